@@ -9,166 +9,295 @@ Usage: python python_bridge.py [port]
 Default port: 9876
 """
 
+import asyncio
+import functools
+import importlib
+import importlib.util
 import json
+import os
 import sys
-from http.server import BaseHTTPRequestHandler, HTTPServer
-
-# Add src to path for development
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from pytypopo import fix_typos
-from pytypopo.locale import get_locale
-
-# Punctuation modules
-from pytypopo.modules.punctuation.dash import (
-    fix_dash,
-    fix_dash_between_cardinal_numbers,
-    fix_dash_between_ordinal_numbers,
-    fix_dash_between_percentage_range,
-    fix_dash_between_word_and_brackets,
-    fix_dash_between_word_and_punctuation,
-    fix_dashes_between_words,
-)
-from pytypopo.modules.punctuation.double_quotes import fix_double_quotes_and_primes
-from pytypopo.modules.punctuation.ellipsis import (
-    fix_ellipsis,
-    replace_three_chars_with_ellipsis,
-)
-from pytypopo.modules.punctuation.period import fix_period
-from pytypopo.modules.punctuation.single_quotes import fix_single_quotes_primes_and_apostrophes
-
-# Symbol modules
-from pytypopo.modules.symbols.copyrights import fix_copyrights
-from pytypopo.modules.symbols.exponents import fix_exponents
-from pytypopo.modules.symbols.marks import fix_marks
-from pytypopo.modules.symbols.multiplication_sign import fix_multiplication_sign
-from pytypopo.modules.symbols.number_sign import fix_number_sign
-from pytypopo.modules.symbols.numero_sign import fix_numero_sign
-from pytypopo.modules.symbols.plus_minus import fix_plus_minus
-from pytypopo.modules.symbols.section_sign import fix_section_sign
-
-# Whitespace modules
-from pytypopo.modules.whitespace.lines import fix_lines
-from pytypopo.modules.whitespace.nbsp import fix_nbsp
-from pytypopo.modules.whitespace.spaces import fix_spaces
-
-# Word modules
-from pytypopo.modules.words.abbreviations import (
-    fix_abbreviations,
-    fix_initials,
-    fix_multiple_word_abbreviations,
-    fix_single_word_abbreviations,
-)
-from pytypopo.modules.words.case import fix_case
-from pytypopo.modules.words.exceptions import exclude_exceptions, place_exceptions
-from pytypopo.modules.words.pub_id import fix_pub_id
-
-# Map JS function names (camelCase) to Python functions
-# Format: 'jsFunctionName': (python_func, needs_locale)
-FUNCTION_MAP = {
-    # Main API
-    "fixTypos": (fix_typos, True),
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# orjson is optional; it encodes/decodes large text payloads much faster
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# aiohttp is optional; its C HTTP parser and event loop cut per-request overhead
+try:
+    from aiohttp import web
+except ImportError:  # pragma: no cover - depends on the environment
+    web = None
+
+# Add src to path for development, unless pytypopo is installed
+# (find_spec checks without importing, keeping function imports lazy)
+if importlib.util.find_spec("pytypopo") is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+_PUNCTUATION = "pytypopo.modules.punctuation"
+_SYMBOLS = "pytypopo.modules.symbols"
+_WHITESPACE = "pytypopo.modules.whitespace"
+_WORDS = "pytypopo.modules.words"
+
+# Map JS function names (camelCase) to Python functions, imported on first use
+# Format: 'jsFunctionName': ('module.path:python_func', needs_locale)
+_FUNCTIONS = {
     # Punctuation - dash
-    "fixDash": (fix_dash, True),
-    "fixDashesBetweenWords": (fix_dashes_between_words, True),
-    "fixDashBetweenWordAndPunctuation": (fix_dash_between_word_and_punctuation, True),
-    "fixDashBetweenWordAndBrackets": (fix_dash_between_word_and_brackets, True),
-    "fixDashBetweenCardinalNumbers": (fix_dash_between_cardinal_numbers, False),
-    "fixDashBetweenPercentageRange": (fix_dash_between_percentage_range, False),
-    "fixDashBetweenOrdinalNumbers": (fix_dash_between_ordinal_numbers, True),
+    "fixDash": (f"{_PUNCTUATION}.dash:fix_dash", True),
+    "fixDashesBetweenWords": (f"{_PUNCTUATION}.dash:fix_dashes_between_words", True),
+    "fixDashBetweenWordAndPunctuation": (f"{_PUNCTUATION}.dash:fix_dash_between_word_and_punctuation", True),
+    "fixDashBetweenWordAndBrackets": (f"{_PUNCTUATION}.dash:fix_dash_between_word_and_brackets", True),
+    "fixDashBetweenCardinalNumbers": (f"{_PUNCTUATION}.dash:fix_dash_between_cardinal_numbers", False),
+    "fixDashBetweenPercentageRange": (f"{_PUNCTUATION}.dash:fix_dash_between_percentage_range", False),
+    "fixDashBetweenOrdinalNumbers": (f"{_PUNCTUATION}.dash:fix_dash_between_ordinal_numbers", True),
     # Punctuation - other
-    "fixDoubleQuotes": (fix_double_quotes_and_primes, True),
-    "fixDoubleQuotesAndPrimes": (fix_double_quotes_and_primes, True),
-    "fixSingleQuotes": (fix_single_quotes_primes_and_apostrophes, True),
-    "fixSingleQuotesPrimesAndApostrophes": (fix_single_quotes_primes_and_apostrophes, True),
-    "fixEllipsis": (fix_ellipsis, True),
-    "replaceThreeCharsWithEllipsis": (replace_three_chars_with_ellipsis, False),
-    "fixPeriod": (fix_period, True),
+    "fixDoubleQuotes": (f"{_PUNCTUATION}.double_quotes:fix_double_quotes_and_primes", True),
+    "fixDoubleQuotesAndPrimes": (f"{_PUNCTUATION}.double_quotes:fix_double_quotes_and_primes", True),
+    "fixSingleQuotes": (f"{_PUNCTUATION}.single_quotes:fix_single_quotes_primes_and_apostrophes", True),
+    "fixSingleQuotesPrimesAndApostrophes": (
+        f"{_PUNCTUATION}.single_quotes:fix_single_quotes_primes_and_apostrophes",
+        True,
+    ),
+    "fixEllipsis": (f"{_PUNCTUATION}.ellipsis:fix_ellipsis", True),
+    "replaceThreeCharsWithEllipsis": (f"{_PUNCTUATION}.ellipsis:replace_three_chars_with_ellipsis", False),
+    "fixPeriod": (f"{_PUNCTUATION}.period:fix_period", True),
     # Symbols
-    "fixCopyrights": (fix_copyrights, True),
-    "fixExponents": (fix_exponents, True),
-    "fixMarks": (fix_marks, True),
-    "fixMultiplicationSign": (fix_multiplication_sign, True),
-    "fixNumberSign": (fix_number_sign, True),
-    "fixNumeroSign": (fix_numero_sign, True),
-    "fixPlusMinus": (fix_plus_minus, True),
-    "fixSectionSign": (fix_section_sign, True),
+    "fixCopyrights": (f"{_SYMBOLS}.copyrights:fix_copyrights", True),
+    "fixExponents": (f"{_SYMBOLS}.exponents:fix_exponents", True),
+    "fixMarks": (f"{_SYMBOLS}.marks:fix_marks", True),
+    "fixMultiplicationSign": (f"{_SYMBOLS}.multiplication_sign:fix_multiplication_sign", True),
+    "fixNumberSign": (f"{_SYMBOLS}.number_sign:fix_number_sign", True),
+    "fixNumeroSign": (f"{_SYMBOLS}.numero_sign:fix_numero_sign", True),
+    "fixPlusMinus": (f"{_SYMBOLS}.plus_minus:fix_plus_minus", True),
+    "fixSectionSign": (f"{_SYMBOLS}.section_sign:fix_section_sign", True),
     # Whitespace
-    "fixLines": (fix_lines, True),
-    "fixNbsp": (fix_nbsp, True),
-    "fixSpaces": (fix_spaces, True),
+    "fixLines": (f"{_WHITESPACE}.lines:fix_lines", True),
+    "fixNbsp": (f"{_WHITESPACE}.nbsp:fix_nbsp", True),
+    "fixSpaces": (f"{_WHITESPACE}.spaces:fix_spaces", True),
     # Words
-    "fixAbbreviations": (fix_abbreviations, True),
-    "fixInitials": (fix_initials, True),
-    "fixSingleWordAbbreviations": (fix_single_word_abbreviations, True),
-    "fixMultipleWordAbbreviations": (fix_multiple_word_abbreviations, True),
-    "fixCase": (fix_case, False),
-    "fixPubId": (fix_pub_id, False),
+    "fixAbbreviations": (f"{_WORDS}.abbreviations:fix_abbreviations", True),
+    "fixInitials": (f"{_WORDS}.abbreviations:fix_initials", True),
+    "fixSingleWordAbbreviations": (f"{_WORDS}.abbreviations:fix_single_word_abbreviations", True),
+    "fixMultipleWordAbbreviations": (f"{_WORDS}.abbreviations:fix_multiple_word_abbreviations", True),
+    "fixCase": (f"{_WORDS}.case:fix_case", False),
+    "fixPubId": (f"{_WORDS}.pub_id:fix_pub_id", False),
     # Exceptions
-    "excludeExceptions": (exclude_exceptions, False),
-    "placeExceptions": (place_exceptions, False),
+    "excludeExceptions": (f"{_WORDS}.exceptions:exclude_exceptions", False),
+    "placeExceptions": (f"{_WORDS}.exceptions:place_exceptions", False),
+}
+
+
+@functools.cache
+def _resolve(spec):
+    """Import 'module.path:name' and return the named attribute (cached per spec)."""
+    module_name, attr = spec.split(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _get_locale(locale_str):
+    return _resolve("pytypopo.locale:get_locale")(locale_str)
+
+
+def _fix_typos_adapter(text, locale_str, config):
+    # Main API has keyword arguments
+    return _resolve("pytypopo:fix_typos")(
+        text,
+        locale_str,
+        remove_lines=config.get("removeLines", True),
+    )
+
+
+@functools.cache
+def _adapt(spec, needs_locale):
+    """Wrap the function at spec as an adapter with the uniform (text, locale_str, config) signature.
+
+    Cached, so aliases of one function (fixDoubleQuotes/fixDoubleQuotesAndPrimes) share one adapter.
+    """
+    if needs_locale:
+
+        def adapter(text, locale_str, config):
+            return _resolve(spec)(text, _get_locale(locale_str))
+
+    else:
+
+        def adapter(text, locale_str, config):
+            return _resolve(spec)(text)
+
+    return adapter
+
+
+# Map JS function names to adapters: (text, locale_str, config) -> result
+FUNCTION_MAP = {
+    # Main API
+    "fixTypos": _fix_typos_adapter,
+    **{name: _adapt(spec, needs_locale) for name, (spec, needs_locale) in _FUNCTIONS.items()},
 }
 
 
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:  # pragma: no cover - depends on the environment
+    _json_loads = json.loads
+
+    def _json_dumps(payload):
+        return json.dumps(payload, ensure_ascii=False).encode()
+
+
+# 404 body for unknown functions; the JS adapter only looks at the status
+_NOT_FOUND = _json_dumps({"error": "Unknown function"})
+
+
+@functools.lru_cache(maxsize=128)
+def _error_body(message):
+    """Encoded 500 body; failing test cases repeat the same few messages."""
+    return _json_dumps({"error": message})
+
+
+def _call(request):
+    """Run a single bridge request and return the function's result."""
+    # Interned keys make the FUNCTION_MAP and get_locale cache lookups identity hits
+    func_name = sys.intern(request["function"])
+    text = request["text"]
+    locale_str = sys.intern(request.get("locale") or "en-us")
+    config = request.get("config", {})
+
+    return FUNCTION_MAP[func_name](text, locale_str, config)
+
+
+def _warm():
+    """Pool worker initializer: build every locale up front so no request pays for it."""
+    for locale_str in ("en-us", "de-de", "cs", "sk", "rue"):
+        _get_locale(sys.intern(locale_str))
+
+
+def _call_batch_entry(request):
+    """Run one entry of a batch, reporting failures per entry instead of per batch."""
+    try:
+        if request["function"] not in FUNCTION_MAP:
+            return {"error": f"Unknown function: {request['function']}"}
+        return {"result": _call(request)}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+# Worker processes run the (CPU-bound) requests so they spread across cores instead of
+# contending for the GIL; created in main() so importing the bridge spawns nothing
+POOL = None
+
+
 class BridgeHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections alive between requests from the JS suite
+    protocol_version = "HTTP/1.1"
+
     def log_message(self, format, *args):
         # Suppress default logging for cleaner output
         pass
 
+    def _send_json(self, status, payload):
+        self._send_body(status, _json_dumps(payload))
+
+    def _send_body(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_POST(self):
         try:
             content_length = int(self.headers["Content-Length"])
-            body = json.loads(self.rfile.read(content_length))
+            body = _json_loads(self.rfile.read(content_length))
 
-            func_name = body["function"]
-            text = body["text"]
-            locale_str = body.get("locale", "en-us")
-            config = body.get("config", {})
+            # POST /batch {"batch": [request, ...]} -> {"results": [{"result": ...} | {"error": ...}, ...]}
+            if self.path == "/batch":
+                self._send_json(200, {"results": list(POOL.map(_call_batch_entry, body["batch"]))})
+                return
 
+            func_name = body["function"]
             if func_name not in FUNCTION_MAP:
-                self.send_error(404, f"Unknown function: {func_name}")
+                self._send_body(404, _NOT_FOUND)
                 return
 
-            func, needs_locale = FUNCTION_MAP[func_name]
-
-            # Build arguments
-            if func_name == "fixTypos":
-                # Main API has keyword arguments
-                result = fix_typos(
-                    text,
-                    locale_str,
-                    remove_lines=config.get("removeLines", True),
-                )
-            elif needs_locale:
-                loc = get_locale(locale_str)
-                result = func(text, loc)
-            else:
-                result = func(text)
-
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps({"result": result}).encode())
+            self._send_json(200, {"result": POOL.submit(_call, body).result()})
 
         except Exception as e:
-            self.send_response(500)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps({"error": str(e)}).encode())
+            self._send_body(500, _error_body(str(e)))
+
+
+def _json_response(status, payload):
+    return _body_response(status, _json_dumps(payload))
+
+
+def _body_response(status, body):
+    return web.Response(status=status, body=body, content_type="application/json", charset="utf-8")
+
+
+async def _handle_call(request):
+    try:
+        body = _json_loads(await request.read())
+
+        func_name = body["function"]
+        if func_name not in FUNCTION_MAP:
+            return _body_response(404, _NOT_FOUND)
+
+        result = await asyncio.get_running_loop().run_in_executor(POOL, _call, body)
+        return _json_response(200, {"result": result})
+
+    except Exception as e:
+        return _body_response(500, _error_body(str(e)))
+
+
+async def _handle_batch(request):
+    # POST /batch {"batch": [request, ...]} -> {"results": [{"result": ...} | {"error": ...}, ...]}
+    try:
+        body = _json_loads(await request.read())
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(POOL, _call_batch_entry, entry) for entry in body["batch"])
+        )
+        return _json_response(200, {"results": results})
+
+    except Exception as e:
+        return _body_response(500, _error_body(str(e)))
+
+
+def _serve_aiohttp(port):
+    app = web.Application()
+    app.router.add_post("/", _handle_call)
+    app.router.add_post("/batch", _handle_batch)
+    # run_app handles Ctrl+C itself and returns once the server is closed
+    web.run_app(app, host="127.0.0.1", port=port, print=None)
+
+
+def _serve_threaded(port):
+    server = ThreadingHTTPServer(("127.0.0.1", port), BridgeHandler)
+    # Don't let open keep-alive connections block shutdown
+    server.daemon_threads = True
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
 
 
 def main():
+    global POOL
+
     port = int(sys.argv[1]) if len(sys.argv) > 1 else 9876
-    server = HTTPServer(("127.0.0.1", port), BridgeHandler)
+    POOL = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_warm)
     print(f"🐍 Python bridge listening on http://127.0.0.1:{port}")
-    print(f"   Exposing {len(FUNCTION_MAP)} functions")
+    print(f"   Exposing {len(FUNCTION_MAP)} functions on {os.cpu_count()} workers")
     try:
-        server.serve_forever()
-    except KeyboardInterrupt:
+        if web is not None:
+            _serve_aiohttp(port)
+        else:  # pragma: no cover - depends on the environment
+            _serve_threaded(port)
         print("\n👋 Shutting down")
-        server.shutdown()
+    finally:
+        POOL.shutdown(cancel_futures=True)
 
 
 if __name__ == "__main__":
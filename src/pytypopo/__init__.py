@@ -6,33 +6,110 @@ Python port of typopo (https://github.com/surfinzap/typopo/)
 
 __version__ = "3.0.1+py0"
 
+import importlib
+import re
+import sys
+from functools import partial
+
 from pytypopo.locale import get_locale
-from pytypopo.modules.punctuation import (
-    fix_dash,
-    fix_double_quotes,
-    fix_ellipsis,
-    fix_period,
-    fix_single_quotes,
-)
-from pytypopo.modules.symbols import (
-    fix_copyrights,
-    fix_exponents,
-    fix_marks,
-    fix_multiplication_sign,
-    fix_number_sign,
-    fix_numero_sign,
-    fix_plus_minus,
-    fix_section_sign,
-)
-from pytypopo.modules.whitespace import fix_lines, fix_nbsp, fix_spaces
-from pytypopo.modules.words import (
-    exclude_exceptions,
-    fix_abbreviations,
-    fix_case,
-    fix_pub_id,
-    place_exceptions,
+
+# Module functions are imported on first access (PEP 562), so importing
+# pytypopo or one of its submodules doesn't load and compile every module
+_LAZY = {
+    "fix_dash": "pytypopo.modules.punctuation",
+    "fix_double_quotes": "pytypopo.modules.punctuation",
+    "fix_ellipsis": "pytypopo.modules.punctuation",
+    "fix_period": "pytypopo.modules.punctuation",
+    "fix_single_quotes": "pytypopo.modules.punctuation",
+    "fix_copyrights": "pytypopo.modules.symbols",
+    "fix_exponents": "pytypopo.modules.symbols",
+    "fix_marks": "pytypopo.modules.symbols",
+    "fix_multiplication_sign": "pytypopo.modules.symbols",
+    "fix_number_sign": "pytypopo.modules.symbols",
+    "fix_numero_sign": "pytypopo.modules.symbols",
+    "fix_plus_minus": "pytypopo.modules.symbols",
+    "fix_section_sign": "pytypopo.modules.symbols",
+    "fix_lines": "pytypopo.modules.whitespace",
+    "fix_nbsp": "pytypopo.modules.whitespace",
+    "fix_spaces": "pytypopo.modules.whitespace",
+    "exclude_exceptions": "pytypopo.modules.words",
+    "fix_abbreviations": "pytypopo.modules.words",
+    "fix_case": "pytypopo.modules.words",
+    "fix_pub_id": "pytypopo.modules.words",
+    "place_exceptions": "pytypopo.modules.words",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+# Attribute access on the module object goes through __getattr__; plain global
+# lookups inside this module don't, so internal callers use _module.<name>
+_module = sys.modules[__name__]
+
+
+# Steps 3-8 of fix_typos as (function name, needs_locale) pairs.
+# Pipeline order matters (prevents re-matching corrected patterns).
+_PIPELINE_STEPS = (
+    # Step 3: Fix ellipsis
+    # Must run before space cleanup due to variable spacing in source
+    ("fix_ellipsis", True),
+    # Step 4: Fix general whitespace (spaces, leading/trailing)
+    ("fix_spaces", True),
+    # Step 5: Fix punctuation
+    # Order: periods, dashes, double quotes, single quotes
+    ("fix_period", True),
+    ("fix_dash", True),
+    ("fix_double_quotes", True),
+    ("fix_single_quotes", True),
+    # Step 6: Fix symbols
+    # Order follows typopo.js: multiplication, section, copyrights,
+    # numero, plus-minus, marks, exponents, number sign
+    ("fix_multiplication_sign", True),
+    ("fix_section_sign", True),
+    ("fix_copyrights", True),
+    ("fix_numero_sign", True),
+    ("fix_plus_minus", True),
+    ("fix_marks", True),
+    ("fix_exponents", True),
+    ("fix_number_sign", True),
+    # Step 7: Fix words
+    # Order: case, pub_id, abbreviations
+    # Note: fix_case and fix_pub_id are locale-independent
+    ("fix_case", False),
+    ("fix_pub_id", False),
+    ("fix_abbreviations", True),
+    # Step 8: Apply non-breaking space rules (locale-specific)
+    ("fix_nbsp", True),
 )
 
+# Text made only of ASCII words of 2+ letters (all lowercase, or capitalized),
+# separated by single spaces or newlines. No module changes such text: every rule
+# needs punctuation, a digit, a symbol, repeated or edge whitespace, a single-letter
+# word (prepositions, "x", "I") or two adjacent uppercase letters ("JEnnifer", "IV").
+_UNCHANGED_TEXT_PATTERN = re.compile(r"(?:[A-Z][a-z]|[a-z]{2})[a-z]*(?:[ \n](?:[A-Z][a-z]|[a-z]{2})[a-z]*)*")
+
+# Pipelines with the Locale bound in, keyed by locale ID (built on first use)
+_PIPELINE_CACHE = {}
+
+
+def _get_pipeline(loc):
+    """Return the cached tuple of single-argument pipeline steps for a Locale."""
+    pipeline = _PIPELINE_CACHE.get(loc.locale_id)
+    if pipeline is None:
+        pipeline = tuple(
+            partial(getattr(_module, name), locale=loc) if needs_locale else getattr(_module, name)
+            for name, needs_locale in _PIPELINE_STEPS
+        )
+        _PIPELINE_CACHE[loc.locale_id] = pipeline
+    return pipeline
+
 
 def fix_typos(
     text,
@@ -81,58 +158,30 @@ def fix_typos(
     if not text or not text.strip():
         return ""
 
+    # Fast path: plain words that no rule can touch are returned as-is
+    if _UNCHANGED_TEXT_PATTERN.fullmatch(text):
+        return text
+
     # Get locale configuration
     loc = get_locale(locale)
 
     # Step 1: Exclude exceptions (URLs, emails, filenames)
     # These are replaced with placeholders to protect from modification
-    exception_result = exclude_exceptions(text)
+    exception_result = _module.exclude_exceptions(text)
     text = exception_result["processed_text"]
     exceptions = exception_result["exceptions"]
 
     # Step 2: Remove empty lines (optional)
     # Must run early to avoid interfering with other patterns
     if remove_lines:
-        text = fix_lines(text, loc)
-
-    # Step 3: Fix ellipsis
-    # Must run before space cleanup due to variable spacing in source
-    text = fix_ellipsis(text, loc)
-
-    # Step 4: Fix general whitespace (spaces, leading/trailing)
-    text = fix_spaces(text, loc)
-
-    # Step 5: Fix punctuation
-    # Order: periods, dashes, double quotes, single quotes
-    text = fix_period(text, loc)
-    text = fix_dash(text, loc)
-    text = fix_double_quotes(text, loc)
-    text = fix_single_quotes(text, loc)
+        text = _module.fix_lines(text, loc)
 
-    # Step 6: Fix symbols
-    # Order follows typopo.js: multiplication, section, copyrights,
-    # numero, plus-minus, marks, exponents, number sign
-    text = fix_multiplication_sign(text, loc)
-    text = fix_section_sign(text, loc)
-    text = fix_copyrights(text, loc)
-    text = fix_numero_sign(text, loc)
-    text = fix_plus_minus(text, loc)
-    text = fix_marks(text, loc)
-    text = fix_exponents(text, loc)
-    text = fix_number_sign(text, loc)
-
-    # Step 7: Fix words
-    # Order: case, pub_id, abbreviations
-    # Note: fix_case and fix_pub_id are locale-independent
-    text = fix_case(text)
-    text = fix_pub_id(text)
-    text = fix_abbreviations(text, loc)
-
-    # Step 8: Apply non-breaking space rules (locale-specific)
-    text = fix_nbsp(text, loc)
+    # Steps 3-8: ellipsis, spaces, punctuation, symbols, words, nbsp
+    for step in _get_pipeline(loc):
+        text = step(text)
 
     # Step 9: Restore exceptions (URLs, emails, filenames)
-    text = place_exceptions(text, exceptions)
+    text = _module.place_exceptions(text, exceptions)
 
     return text
 
@@ -4,6 +4,8 @@ Locale class for pytypopo - defines quote characters and ordinal indicators per
 Based on: https://github.com/surfinzap/typopo/tree/main/src/locale
 """
 
+import sys
+
 # Quote character constants
 # Unicode code points to avoid any encoding issues
 
@@ -157,10 +159,29 @@ LOCALE_CONFIGS = {
     },
 }
 
+# Intern the settings: locales share most of these short strings (NBSP, dashes, quotes),
+# so every Locale and every replacement built from them points at one object
+for _config in LOCALE_CONFIGS.values():
+    for _key, _value in _config.items():
+        _config[_key] = sys.intern(_value)
+del _config, _key, _value
+
 # Set of supported locale IDs for quick lookup
 SUPPORTED_LOCALES = frozenset(LOCALE_CONFIGS.keys())
 
 
+def _normalize_locale_id(locale_id):
+    """Normalize locale ID to lowercase, defaulting to en-us if invalid."""
+    if not locale_id:
+        return DEFAULT_LOCALE
+
+    normalized = locale_id.strip().lower()
+    if normalized not in SUPPORTED_LOCALES:
+        return DEFAULT_LOCALE
+
+    return normalized
+
+
 class Locale:
     """
     Locale configuration for typography fixes.
@@ -168,8 +189,52 @@ class Locale:
     Provides locale-specific quote characters, ordinal indicators,
     and non-breaking space settings.
     Invalid or None locale IDs default to 'en-us'.
+
+    Settings are plain read-only slot attributes:
+        locale_id: The normalized locale identifier.
+        double_quote_open, double_quote_close: Double quote characters.
+        single_quote_open, single_quote_close: Single quote characters.
+        terminal_quotes: Combined closing quote characters for pattern matching.
+        ordinal_indicator: Regex pattern for ordinal suffixes in this locale.
+        roman_ordinal_indicator: Regex pattern for roman numeral ordinal suffixes (e.g., IV.)
+        ordinal_date_first_space: Space after day in ordinal dates (e.g., 1. 2.)
+        ordinal_date_second_space: Space after month in ordinal dates.
+        space_before_percent: Space before percent sign (empty for en-us).
+        dash_space_before, dash_space_after: Spaces around a dash between words.
+        dash_char: Dash character between words (em dash or en dash).
+        dash_replacement: Dash between words with its spaces before and after.
+        space_after_abbreviation: Space between abbreviated words (e.g., F.{space}X. Salda, e.{space}g.).
+        space_after_copyright: Space after copyright sign (©).
+        space_after_sound_recording_copyright: Space after sound recording copyright sign (℗).
+        space_after_numero_sign: Space after numero sign (№).
+        space_after_section_sign: Space after section sign (§).
+        space_after_paragraph_sign: Space after paragraph sign (¶).
     """
 
+    __slots__ = (
+        "locale_id",
+        "double_quote_open",
+        "double_quote_close",
+        "single_quote_open",
+        "single_quote_close",
+        "ordinal_indicator",
+        "roman_ordinal_indicator",
+        "ordinal_date_first_space",
+        "ordinal_date_second_space",
+        "space_before_percent",
+        "dash_space_before",
+        "dash_char",
+        "dash_space_after",
+        "space_after_abbreviation",
+        "space_after_copyright",
+        "space_after_sound_recording_copyright",
+        "space_after_numero_sign",
+        "space_after_section_sign",
+        "space_after_paragraph_sign",
+        "terminal_quotes",
+        "dash_replacement",
+    )
+
     def __init__(self, locale_id=None):
         # Normalize locale_id: handle None, empty string, and case variations
         normalized_id = self._normalize_locale_id(locale_id)
@@ -177,142 +242,35 @@ class Locale:
         # Load configuration for this locale
         config = LOCALE_CONFIGS[normalized_id]
 
-        self._locale_id = normalized_id
-        self._double_quote_open = config["double_quote_open"]
-        self._double_quote_close = config["double_quote_close"]
-        self._single_quote_open = config["single_quote_open"]
-        self._single_quote_close = config["single_quote_close"]
-        self._ordinal_indicator = config["ordinal_indicator"]
-        self._roman_ordinal_indicator = config["roman_ordinal_indicator"]
-        self._ordinal_date_first_space = config["ordinal_date_first_space"]
-        self._ordinal_date_second_space = config["ordinal_date_second_space"]
-        self._space_before_percent = config["space_before_percent"]
-        self._dash_space_before = config["dash_space_before"]
-        self._dash_char = config["dash_char"]
-        self._dash_space_after = config["dash_space_after"]
-        self._space_after_abbreviation = config["space_after_abbreviation"]
-        self._space_after_copyright = config["space_after_copyright"]
-        self._space_after_sound_recording_copyright = config["space_after_sound_recording_copyright"]
-        self._space_after_numero_sign = config["space_after_numero_sign"]
-        self._space_after_section_sign = config["space_after_section_sign"]
-        self._space_after_paragraph_sign = config["space_after_paragraph_sign"]
+        # Instances are shared between callers, so attributes are set once here
+        # and __setattr__ refuses any later change
+        set_attr = object.__setattr__
+        set_attr(self, "locale_id", normalized_id)
+        for name, value in config.items():
+            set_attr(self, name, value)
 
         # terminal_quotes: combined closing quotes for pattern matching
-        self._terminal_quotes = self._double_quote_close + self._single_quote_close
+        set_attr(self, "terminal_quotes", sys.intern(self.double_quote_close + self.single_quote_close))
+
+        # dash_replacement: dash between words with its surrounding spaces
+        set_attr(self, "dash_replacement", sys.intern(self.dash_space_before + self.dash_char + self.dash_space_after))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Locale attribute {name!r} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Locale attribute {name!r} is read-only")
 
     def _normalize_locale_id(self, locale_id):
         """Normalize locale ID to lowercase, defaulting to en-us if invalid."""
-        if not locale_id:
-            return DEFAULT_LOCALE
-
-        normalized = locale_id.lower()
-        if normalized not in SUPPORTED_LOCALES:
-            return DEFAULT_LOCALE
-
-        return normalized
-
-    @property
-    def locale_id(self):
-        """The normalized locale identifier."""
-        return self._locale_id
-
-    @property
-    def double_quote_open(self):
-        """Opening double quote character for this locale."""
-        return self._double_quote_open
-
-    @property
-    def double_quote_close(self):
-        """Closing double quote character for this locale."""
-        return self._double_quote_close
-
-    @property
-    def single_quote_open(self):
-        """Opening single quote character for this locale."""
-        return self._single_quote_open
-
-    @property
-    def single_quote_close(self):
-        """Closing single quote character for this locale."""
-        return self._single_quote_close
-
-    @property
-    def terminal_quotes(self):
-        """Combined closing quote characters for pattern matching."""
-        return self._terminal_quotes
-
-    @property
-    def ordinal_indicator(self):
-        """Regex pattern for ordinal suffixes in this locale."""
-        return self._ordinal_indicator
-
-    @property
-    def roman_ordinal_indicator(self):
-        """Regex pattern for roman numeral ordinal suffixes (e.g., IV.)"""
-        return self._roman_ordinal_indicator
-
-    @property
-    def ordinal_date_first_space(self):
-        """Space character to use after day in ordinal dates (e.g., 1. 2.)"""
-        return self._ordinal_date_first_space
-
-    @property
-    def ordinal_date_second_space(self):
-        """Space character to use after month in ordinal dates."""
-        return self._ordinal_date_second_space
-
-    @property
-    def space_before_percent(self):
-        """Space character to use before percent sign (empty for en-us)."""
-        return self._space_before_percent
-
-    @property
-    def dash_space_before(self):
-        """Space character to use before dash between words."""
-        return self._dash_space_before
-
-    @property
-    def dash_char(self):
-        """Dash character to use between words (em dash or en dash)."""
-        return self._dash_char
-
-    @property
-    def dash_space_after(self):
-        """Space character to use after dash between words."""
-        return self._dash_space_after
-
-    @property
-    def space_after_abbreviation(self):
-        """Space character between abbreviated words (e.g., F.{space}X. Salda, e.{space}g.)."""
-        return self._space_after_abbreviation
-
-    @property
-    def space_after_copyright(self):
-        """Space character after copyright sign (©)."""
-        return self._space_after_copyright
-
-    @property
-    def space_after_sound_recording_copyright(self):
-        """Space character after sound recording copyright sign (℗)."""
-        return self._space_after_sound_recording_copyright
-
-    @property
-    def space_after_numero_sign(self):
-        """Space character after numero sign (№)."""
-        return self._space_after_numero_sign
-
-    @property
-    def space_after_section_sign(self):
-        """Space character after section sign (§)."""
-        return self._space_after_section_sign
-
-    @property
-    def space_after_paragraph_sign(self):
-        """Space character after paragraph sign (¶)."""
-        return self._space_after_paragraph_sign
+        return _normalize_locale_id(locale_id)
 
     def __repr__(self):
-        return f"Locale({self._locale_id!r})"
+        return f"Locale({self.locale_id!r})"
+
+
+# Shared, read-only Locale instances for every supported locale, built once at import
+_LOCALE_INSTANCES = {locale_id: Locale(locale_id) for locale_id in LOCALE_CONFIGS}
 
 
 def get_locale(locale_id="en-us"):
@@ -327,9 +285,16 @@ def get_locale(locale_id="en-us"):
     Returns:
         Locale instance with appropriate quote characters and settings.
         If locale_id is already a Locale instance, returns it unchanged.
+        Locale instances are read-only, so one instance is cached and
+        shared per normalized locale ID (e.g. 'EN-US' and 'en-us').
     """
+    # Canonical lowercase IDs, by far the most common argument, take a single dict probe
+    locale = _LOCALE_INSTANCES.get(locale_id)
+    if locale is not None:
+        return locale
+
     # If already a Locale instance, return unchanged
     if isinstance(locale_id, Locale):
         return locale_id
 
-    return Locale(locale_id)
+    return _LOCALE_INSTANCES[_normalize_locale_id(locale_id)]
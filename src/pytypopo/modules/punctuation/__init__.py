@@ -5,15 +5,32 @@ Provides functions for fixing punctuation issues including periods,
 ellipsis, dashes, and quotes.
 """
 
-from pytypopo.modules.punctuation.dash import fix_dash
-from pytypopo.modules.punctuation.double_quotes import fix_double_quotes_and_primes
-from pytypopo.modules.punctuation.ellipsis import fix_ellipsis
-from pytypopo.modules.punctuation.period import fix_period
-from pytypopo.modules.punctuation.single_quotes import fix_single_quotes_primes_and_apostrophes
+import importlib
+
+# Functions are imported from their submodule on first access (PEP 562),
+# so using one fix doesn't load and compile the patterns of all the others.
+# Format: 'name': ('submodule', 'function name in the submodule')
+_LAZY = {
+    "fix_dash": ("dash", "fix_dash"),
+    "fix_double_quotes_and_primes": ("double_quotes", "fix_double_quotes_and_primes"),
+    "fix_ellipsis": ("ellipsis", "fix_ellipsis"),
+    "fix_period": ("period", "fix_period"),
+    "fix_single_quotes_primes_and_apostrophes": ("single_quotes", "fix_single_quotes_primes_and_apostrophes"),
+    # Aliases for simpler names
+    "fix_double_quotes": ("double_quotes", "fix_double_quotes_and_primes"),
+    "fix_single_quotes": ("single_quotes", "fix_single_quotes_primes_and_apostrophes"),
+}
+
+
+def __getattr__(name):
+    spec = _LAZY.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    submodule, attr = spec
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), attr)
+    globals()[name] = value
+    return value
 
-# Aliases for simpler names
-fix_double_quotes = fix_double_quotes_and_primes
-fix_single_quotes = fix_single_quotes_primes_and_apostrophes
 
 __all__ = [
     "fix_dash",
@@ -13,6 +13,7 @@ Handles:
 """
 
 import re
+from functools import cache
 
 from pytypopo.const import (
     ALL_CHARS,
@@ -28,14 +29,188 @@ from pytypopo.const import (
     SPACES,
 )
 from pytypopo.locale.base import get_locale
-from pytypopo.utils.regex_overlap import replace_with_overlap_handling
 
+# Character-class fragments shared by the patterns below, built once at import
+_LETTER = f"[{ALL_CHARS}]"
+_LETTER_OR_DIGIT = rf"[{ALL_CHARS}\d]"
+_SPACE = f"[{SPACES}]"
+_DASH = f"[{HYPHEN}{EN_DASH}{EM_DASH}]"
+_DASHES = f"{_DASH}{{1,3}}"
+_OPENING_BRACKET = f"[{OPENING_BRACKETS}]"
+_CLOSING_BRACKET = f"[{CLOSING_BRACKETS}]"
+_BRACKET = f"[{OPENING_BRACKETS}{CLOSING_BRACKETS}]"
+_PERCENT_SIGN = f"[{PERCENT}{PERMILLE}{PERMYRIAD}]"
+
+# Probe for ordinal ranges, which need a digit on both sides of the dash
+_DIGIT_PATTERN = re.compile(r"\d")
+
+# Dashes between words or between a word and a number:
+# - Word/digit followed by
+# - Dash(es) with optional spaces (but hyphen requires spaces on both sides)
+# - Word/digit
+#
+# Two alternatives:
+# 1. Any spaces + en/em dash(es) + any spaces
+# 2. Required spaces + hyphen(s) + required spaces
+_DASHES_BETWEEN_WORDS_PATTERN = re.compile(
+    rf"({_LETTER_OR_DIGIT})"
+    rf"("
+    rf"{_SPACE}*[{EN_DASH}{EM_DASH}]{{1,3}}{_SPACE}*"
+    rf"|"
+    rf"{_SPACE}+[{HYPHEN}]{{1,3}}{_SPACE}+"
+    rf")"
+    rf"({_LETTER_OR_DIGIT})"
+)
 
-def _get_locale_obj(locale):
-    """Convert locale string to Locale object if needed."""
-    if isinstance(locale, str):
-        return get_locale(locale)
-    return locale
+# Dashes before punctuation:
+# - Letter followed by
+# - Optional space, 1-3 dashes, optional space
+# - Punctuation mark or newline
+_DASH_BEFORE_PUNCTUATION_PATTERN = re.compile(
+    rf"({_LETTER})"
+    rf"({_SPACE}?)"
+    rf"({_DASHES})"
+    rf"({_SPACE}?)"
+    rf"([{SENTENCE_PUNCTUATION}]|\n|\r)"
+)
+
+# 1. Dashes entirely within brackets - preserve dash type, only remove spaces
+_DASH_WITHIN_BRACKETS = (
+    rf"(?P<within_open>{_OPENING_BRACKET})"
+    rf"{_SPACE}*"
+    rf"(?P<within_dash>{_DASH}+)"
+    rf"{_SPACE}*"
+    rf"(?P<within_close>{_CLOSING_BRACKET})"
+)
+
+# 2.-6. Dashes between a word or bracket and a bracket.
+# The letters and brackets around the dash are lookarounds, so a bracket can end
+# one match and start the next ("a-(-b") and the replacement is a plain string.
+_DASH_AROUND_BRACKETS = (
+    # 2. Word + dash + opening bracket, 4. Word + dash + closing bracket
+    rf"(?<={_LETTER})"
+    rf"{_SPACE}*{_DASHES}{_SPACE}*"
+    rf"(?={_BRACKET})"
+    rf"|"
+    # 3. Closing bracket + dash + word
+    rf"(?<={_CLOSING_BRACKET})"
+    rf"{_SPACE}*{_DASHES}{_SPACE}*"
+    rf"(?={_LETTER})"
+    rf"|"
+    # 6. Closing bracket + single dash + opening bracket
+    rf"(?<={_CLOSING_BRACKET})"
+    rf"{_SPACE}*{_DASH}{_SPACE}*"
+    rf"(?={_OPENING_BRACKET})"
+    rf"|"
+    # 5. Opening bracket + dash + word
+    rf"(?<={_OPENING_BRACKET})"
+    rf"{_SPACE}*{_DASHES}{_SPACE}*"
+    rf"(?={_LETTER})"
+)
+
+# All bracket cases in one pass; a within-brackets match consumes both brackets,
+# which no around-brackets case could use (none goes from opening to closing bracket)
+_DASH_AT_BRACKETS_PATTERN = re.compile(
+    rf"(?P<within_brackets>{_DASH_WITHIN_BRACKETS})|(?P<around_brackets>{_DASH_AROUND_BRACKETS})"
+)
+
+# Cardinal numbers: digit + optional space + 1-3 dashes + optional space + digit.
+# The digits are lookarounds, so overlapping ranges ("1-2-3") are all matched in one pass.
+_DASH_BETWEEN_CARDINAL_NUMBERS_PATTERN = re.compile(
+    rf"(?<=\d)"
+    rf"{_SPACE}?"
+    rf"{_DASHES}"
+    rf"{_SPACE}?"
+    rf"(?=\d)"
+)
+
+_DASH_BETWEEN_PERCENTAGE_RANGE_PATTERN = re.compile(
+    rf"({_PERCENT_SIGN})"
+    rf"({_SPACE}?{_DASHES}{_SPACE}?)"
+    rf"(\d)"
+)
+
+
+def _has_dash(text):
+    """Whether text contains a hyphen, en dash or em dash; every dash fix needs one."""
+    # Plain containment beats a regex or str.translate probe: it is a C-level search,
+    # and skipped outright for characters wider than the text's storage (EN_DASH in ASCII)
+    return HYPHEN in text or EN_DASH in text or EM_DASH in text
+
+
+@cache
+def _build_patterns(locale_id):
+    """Compiled patterns paired with their replacement strings for one locale."""
+    loc = get_locale(locale_id)
+    dash_replacement = loc.dash_replacement
+
+    # Ordinal numbers: digit + ordinal + optional space + dashes + optional space + digit + ordinal
+    # Case-insensitive matching only matters for letter suffixes (en-us "st|nd|rd|th"),
+    # not for the "\." the other locales use
+    ordinal = loc.ordinal_indicator
+    if any(char.isalpha() for char in ordinal):
+        ordinal = f"(?i:{ordinal})"
+    ordinal_pattern = re.compile(
+        rf"(\d)"
+        rf"({ordinal})"
+        rf"({_SPACE}?{_DASHES}{_SPACE}?)"
+        rf"(\d)"
+        rf"({ordinal})"
+    )
+
+    # Steps 2-6 of fix_dash in one pass. Each alternative rewrites dash runs that no
+    # other one can touch (the characters around a run tell them apart), and all but
+    # ordinals and within-brackets leave their neighbours to lookarounds, so one
+    # scan gives the same result as running the steps one after another.
+    dash_after_words_pattern = re.compile(
+        # 3. Dashes within, and between a word or bracket and, brackets
+        rf"{_DASH_AT_BRACKETS_PATTERN.pattern}"
+        rf"|"
+        # 2. Dashes between a letter and punctuation or end of paragraph
+        rf"(?P<punctuation>"
+        rf"(?<={_LETTER})"
+        rf"{_SPACE}?{_DASHES}{_SPACE}?"
+        rf"(?=[{SENTENCE_PUNCTUATION}]|\n|\r)"
+        rf")"
+        rf"|"
+        # 4.-5. Dashes between cardinal numbers (overlapping, e.g. 1-2-3) and percentage ranges
+        rf"(?P<number_range>"
+        rf"(?<=[\d{PERCENT}{PERMILLE}{PERMYRIAD}])"
+        rf"{_SPACE}?{_DASHES}{_SPACE}?"
+        rf"(?=\d)"
+        rf")"
+        rf"|"
+        # 6. Dashes between ordinal numbers
+        rf"(?P<ordinal_range>"
+        rf"(?P<ordinal_start>\d{ordinal})"
+        rf"{_SPACE}?{_DASHES}{_SPACE}?"
+        rf"(?P<ordinal_end>\d{ordinal})"
+        rf")"
+    )
+    replacements = {
+        "around_brackets": dash_replacement,
+        "punctuation": f"{loc.dash_space_before}{loc.dash_char}",
+        "number_range": EN_DASH,
+    }
+
+    def replace_dash_after_words(match):
+        kind = match.lastgroup
+        if kind == "within_brackets":
+            return f"{match['within_open']}{match['within_dash']}{match['within_close']}"
+        if kind == "ordinal_range":
+            return f"{match['ordinal_start']}{EN_DASH}{match['ordinal_end']}"
+        return replacements[kind]
+
+    return {
+        "between_words": (_DASHES_BETWEEN_WORDS_PATTERN, rf"\1{dash_replacement}\3"),
+        "after_words": (dash_after_words_pattern, replace_dash_after_words),
+        "word_and_punctuation": (
+            _DASH_BEFORE_PUNCTUATION_PATTERN,
+            rf"\1{loc.dash_space_before}{loc.dash_char}\5",
+        ),
+        "word_and_brackets": (_DASH_AT_BRACKETS_PATTERN, replace_dash_after_words),
+        "ordinal_numbers": (ordinal_pattern, rf"\1\2{EN_DASH}\4\5"),
+    }
 
 
 def fix_dashes_between_words(text, locale):
@@ -53,27 +228,9 @@ def fix_dashes_between_words(text, locale):
     Returns:
         Text with fixed dashes between words
     """
-    loc = _get_locale_obj(locale)
-
-    # Pattern matches:
-    # - Word/digit followed by
-    # - Dash(es) with optional spaces (but hyphen requires spaces on both sides)
-    # - Word/digit
-    #
-    # Two alternatives:
-    # 1. Any spaces + en/em dash(es) + any spaces
-    # 2. Required spaces + hyphen(s) + required spaces
-    pattern = re.compile(
-        rf"([{ALL_CHARS}\d])"
-        rf"("
-        rf"[{SPACES}]*[{EN_DASH}{EM_DASH}]{{1,3}}[{SPACES}]*"
-        rf"|"
-        rf"[{SPACES}]+[{HYPHEN}]{{1,3}}[{SPACES}]+"
-        rf")"
-        rf"([{ALL_CHARS}\d])"
-    )
-
-    replacement = rf"\1{loc.dash_space_before}{loc.dash_char}{loc.dash_space_after}\3"
+    if not _has_dash(text):
+        return text
+    pattern, replacement = _build_patterns(get_locale(locale).locale_id)["between_words"]
     return pattern.sub(replacement, text)
 
 
@@ -91,21 +248,9 @@ def fix_dash_between_word_and_punctuation(text, locale):
     Returns:
         Text with fixed dashes before punctuation
     """
-    loc = _get_locale_obj(locale)
-
-    # Pattern matches:
-    # - Letter followed by
-    # - Optional space, 1-3 dashes, optional space
-    # - Punctuation mark or newline
-    pattern = re.compile(
-        rf"([{ALL_CHARS}])"
-        rf"([{SPACES}]?)"
-        rf"([{HYPHEN}{EN_DASH}{EM_DASH}]{{1,3}})"
-        rf"([{SPACES}]?)"
-        rf"([{SENTENCE_PUNCTUATION}]|\n|\r)"
-    )
-
-    replacement = rf"\1{loc.dash_space_before}{loc.dash_char}\5"
+    if not _has_dash(text):
+        return text
+    pattern, replacement = _build_patterns(get_locale(locale).locale_id)["word_and_punctuation"]
     return pattern.sub(replacement, text)
 
 
@@ -128,70 +273,10 @@ def fix_dash_between_word_and_brackets(text, locale):
     Returns:
         Text with fixed dashes around brackets
     """
-    loc = _get_locale_obj(locale)
-    dash_replacement = f"{loc.dash_space_before}{loc.dash_char}{loc.dash_space_after}"
-
-    # 1. Dashes entirely within brackets - preserve dash type, only remove spaces
-    pattern_within = re.compile(
-        rf"([{OPENING_BRACKETS}])"
-        rf"[{SPACES}]*"
-        rf"([{HYPHEN}{EN_DASH}{EM_DASH}]+)"
-        rf"[{SPACES}]*"
-        rf"([{CLOSING_BRACKETS}])"
-    )
-    text = pattern_within.sub(r"\1\2\3", text)
-
-    # 2. Word followed by dash followed by opening bracket
-    pattern_word_open = re.compile(
-        rf"([{ALL_CHARS}])"
-        rf"[{SPACES}]*"
-        rf"[{HYPHEN}{EN_DASH}{EM_DASH}]{{1,3}}"
-        rf"[{SPACES}]*"
-        rf"([{OPENING_BRACKETS}])"
-    )
-    text = pattern_word_open.sub(rf"\1{dash_replacement}\2", text)
-
-    # 3. Closing bracket followed by dash followed by word
-    pattern_close_word = re.compile(
-        rf"([{CLOSING_BRACKETS}])"
-        rf"[{SPACES}]*"
-        rf"[{HYPHEN}{EN_DASH}{EM_DASH}]{{1,3}}"
-        rf"[{SPACES}]*"
-        rf"([{ALL_CHARS}])"
-    )
-    text = pattern_close_word.sub(rf"\1{dash_replacement}\2", text)
-
-    # 4. Word followed by dash followed by closing bracket
-    pattern_word_close = re.compile(
-        rf"([{ALL_CHARS}])"
-        rf"[{SPACES}]*"
-        rf"[{HYPHEN}{EN_DASH}{EM_DASH}]{{1,3}}"
-        rf"[{SPACES}]*"
-        rf"([{CLOSING_BRACKETS}])"
-    )
-    text = pattern_word_close.sub(rf"\1{dash_replacement}\2", text)
-
-    # 5. Opening bracket followed by dash followed by word
-    pattern_open_word = re.compile(
-        rf"([{OPENING_BRACKETS}])"
-        rf"[{SPACES}]*"
-        rf"[{HYPHEN}{EN_DASH}{EM_DASH}]{{1,3}}"
-        rf"[{SPACES}]*"
-        rf"([{ALL_CHARS}])"
-    )
-    text = pattern_open_word.sub(rf"\1{dash_replacement}\2", text)
-
-    # 6. Closing bracket followed by dash followed by opening bracket
-    pattern_close_open = re.compile(
-        rf"([{CLOSING_BRACKETS}])"
-        rf"[{SPACES}]*"
-        rf"[{HYPHEN}{EN_DASH}{EM_DASH}]"
-        rf"[{SPACES}]*"
-        rf"([{OPENING_BRACKETS}])"
-    )
-    text = pattern_close_open.sub(rf"\1{dash_replacement}\2", text)
-
-    return text
+    if not _has_dash(text):
+        return text
+    pattern, replacement = _build_patterns(get_locale(locale).locale_id)["word_and_brackets"]
+    return pattern.sub(replacement, text)
 
 
 def fix_dash_between_cardinal_numbers(text):
@@ -199,8 +284,8 @@ def fix_dash_between_cardinal_numbers(text):
     Fix dashes between cardinal numbers (number ranges).
 
     Replaces hyphen or dash between two numbers with an en dash.
-    Uses two-pass algorithm with overlap handling to prevent missing
-    matches in sequences like "1-2-3".
+    The digits are matched by lookarounds, so sequences like "1-2-3"
+    are fully replaced in a single pass.
 
     Args:
         text: Input text to process
@@ -208,22 +293,9 @@ def fix_dash_between_cardinal_numbers(text):
     Returns:
         Text with en dashes between numbers
     """
-    # Pattern matches: digit + optional space + 1-3 dashes + optional space + digit
-    pattern = re.compile(
-        rf"(\d)"
-        rf"([{SPACES}]?"
-        rf"[{HYPHEN}{EN_DASH}{EM_DASH}]{{1,3}}"
-        rf"[{SPACES}]?)"
-        rf"(\d)"
-    )
-
-    # Pass 1: Replace with placeholder to handle overlapping matches
-    text = replace_with_overlap_handling(text, pattern, r"\1{{typopo__endash}}\3")
-
-    # Pass 2: Replace placeholder with actual en dash
-    text = text.replace("{{typopo__endash}}", EN_DASH)
-
-    return text
+    if not _has_dash(text):
+        return text
+    return _DASH_BETWEEN_CARDINAL_NUMBERS_PATTERN.sub(EN_DASH, text)
 
 
 def fix_dash_between_percentage_range(text):
@@ -239,12 +311,11 @@ def fix_dash_between_percentage_range(text):
     Returns:
         Text with en dashes between percentage ranges
     """
-    pattern = re.compile(
-        rf"([{PERCENT}{PERMILLE}{PERMYRIAD}])"
-        rf"([{SPACES}]?[{HYPHEN}{EN_DASH}{EM_DASH}]{{1,3}}[{SPACES}]?)"
-        rf"(\d)"
-    )
-    return pattern.sub(rf"\1{EN_DASH}\3", text)
+    if not _has_dash(text):
+        return text
+    if PERCENT not in text and PERMILLE not in text and PERMYRIAD not in text:
+        return text
+    return _DASH_BETWEEN_PERCENTAGE_RANGE_PATTERN.sub(rf"\1{EN_DASH}\3", text)
 
 
 def fix_dash_between_ordinal_numbers(text, locale):
@@ -262,21 +333,10 @@ def fix_dash_between_ordinal_numbers(text, locale):
     Returns:
         Text with en dashes between ordinal number ranges
     """
-    loc = _get_locale_obj(locale)
-
-    # Get ordinal indicator pattern for this locale
-    ordinal = loc.ordinal_indicator
-
-    # Pattern matches: digit + ordinal + optional space + dashes + optional space + digit + ordinal
-    pattern = re.compile(
-        rf"(\d)"
-        rf"({ordinal})"
-        rf"([{SPACES}]?[{HYPHEN}{EN_DASH}{EM_DASH}]{{1,3}}[{SPACES}]?)"
-        rf"(\d)"
-        rf"({ordinal})",
-        re.IGNORECASE,
-    )
-    return pattern.sub(rf"\1\2{EN_DASH}\4\5", text)
+    if not _has_dash(text) or not _DIGIT_PATTERN.search(text):
+        return text
+    pattern, replacement = _build_patterns(get_locale(locale).locale_id)["ordinal_numbers"]
+    return pattern.sub(replacement, text)
 
 
 def fix_dash(text, locale):
@@ -298,10 +358,15 @@ def fix_dash(text, locale):
     Returns:
         Text with all dash fixes applied
     """
-    text = fix_dashes_between_words(text, locale)
-    text = fix_dash_between_word_and_punctuation(text, locale)
-    text = fix_dash_between_word_and_brackets(text, locale)
-    text = fix_dash_between_cardinal_numbers(text)
-    text = fix_dash_between_percentage_range(text)
-    text = fix_dash_between_ordinal_numbers(text, locale)
-    return text
+    # Every fix rewrites a hyphen or dash, so text without one is left as is
+    if not _has_dash(text):
+        return text
+
+    patterns = _build_patterns(get_locale(locale).locale_id)
+
+    pattern, replacement = patterns["between_words"]
+    text = pattern.sub(replacement, text)
+
+    # Steps 2-6 run as one combined pass
+    pattern, replacement = patterns["after_words"]
+    return pattern.sub(replacement, text)
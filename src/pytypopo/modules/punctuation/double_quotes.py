@@ -12,6 +12,8 @@ Corrects improper use of double quotes and double primes by:
 """
 
 import re
+from bisect import bisect_left
+from functools import cache
 
 from pytypopo.const import (
     ALL_CHARS,
@@ -28,32 +30,272 @@ from pytypopo.const import (
     TERMINAL_PUNCTUATION,
     UPPERCASE_CHARS,
 )
-from pytypopo.locale import Locale
+from pytypopo.locale import get_locale
 from pytypopo.modules.whitespace.nbsp import add_nbsp_after_preposition
 
 # Quote adepts - various characters that might represent double quotes
 # JS pattern: „|"|"|\"|«|»|″|,{2,}|‚{2,}|['''‹›′´`]{2,}
 # Includes: " (straight), " " (curly), „ (low-9), « » (guillemets), ″ (double prime),
 # ,, (two commas), ‚‚ (two single low-9), and 2+ of: ' ' ' ‹ › ′ ´ `
+# The single characters are one class, which the regex engine tests in one step
+# rather than branch by branch
 DOUBLE_QUOTE_ADEPTS = (
-    r'"'  # straight quote
-    r"|\u201c"  # left double quotation mark "
-    r"|\u201d"  # right double quotation mark "
-    r"|\u201e"  # double low-9 quotation mark „
-    r"|\u00ab"  # left guillemet «
-    r"|\u00bb"  # right guillemet »
-    r"|\u2033"  # double prime ″
+    r'["'  # straight quote
+    r"\u201c"  # left double quotation mark "
+    r"\u201d"  # right double quotation mark "
+    r"\u201e"  # double low-9 quotation mark „
+    r"\u00ab"  # left guillemet «
+    r"\u00bb"  # right guillemet »
+    r"\u2033]"  # double prime ″
     r"|,{2,}"  # two or more commas
     r"|\u201a{2,}"  # two or more single low-9 quotes ‚
     r"|['\u2018\u2019\u2039\u203a\u2032\u00b4`]{2,}"  # 2+ of: ' ' ' ‹ › ′ ´ `
 )
 
+_DOUBLE_QUOTE_ADEPT_PATTERN = re.compile(DOUBLE_QUOTE_ADEPTS)
+
+# Character-class fragments shared by the patterns below, built once at import
+_LETTER = f"[{ALL_CHARS}]"
+_NOT_LETTER = f"[^{ALL_CHARS}]"
+_SPACE = f"[{SPACES}]"
+_DASH = f"[{HYPHEN}{EN_DASH}{EM_DASH}]"
+_ROMAN_NUMERAL = f"[{ROMAN_NUMERALS}]"
+_NOT_ROMAN_NUMERAL = f"[^{ROMAN_NUMERALS}]"
+_SENTENCE_PUNCTUATION_MARK = f"[{SENTENCE_PUNCTUATION}]"
+_PAUSE_PUNCTUATION_MARK = f"[{SENTENCE_PAUSE_PUNCTUATION}]"
+_TERMINAL_PUNCTUATION_MARK = f"[{TERMINAL_PUNCTUATION}{ELLIPSIS}]"
+
+# Temporary labels for identified double primes and quotes (typopo's
+# {{typopo__double-prime}}, {{typopo__ldq}}, ...), replaced with the final characters
+# in place_locale_double_quotes. Single private-use code points keep the patterns
+# that look for them short and the intermediate text no longer than the input.
+_DOUBLE_PRIME_LABEL = "\ue000"
+_LEFT_DOUBLE_QUOTE_LABEL = "\ue001"
+_RIGHT_DOUBLE_QUOTE_LABEL = "\ue002"
+_UNPAIRED_LEFT_DOUBLE_QUOTE_LABEL = "\ue003"
+_UNPAIRED_RIGHT_DOUBLE_QUOTE_LABEL = "\ue004"
+
+# Locale-independent patterns, compiled once at import.
+# Locale-dependent ones are built per locale in _build_patterns.
+
+# Extra punctuation before quotes: not-roman-numeral + sentence-punct + pause-punct + quote-adept
+_EXTRA_PUNCTUATION_BEFORE_QUOTES_PATTERN = re.compile(
+    rf"({_NOT_ROMAN_NUMERAL})"
+    rf"({_SENTENCE_PUNCTUATION_MARK})"
+    rf"({_PAUSE_PUNCTUATION_MARK})"
+    rf"({DOUBLE_QUOTE_ADEPTS})"
+)
+
+# Extra punctuation after quotes: not-roman-numeral + sentence-punct + quote-adept + sentence-punct
+_EXTRA_PUNCTUATION_AFTER_QUOTES_PATTERN = re.compile(
+    rf"({_NOT_ROMAN_NUMERAL})"
+    rf"({_SENTENCE_PUNCTUATION_MARK})"
+    rf"({DOUBLE_QUOTE_ADEPTS})"
+    rf"({_SENTENCE_PUNCTUATION_MARK})"
+)
+
+# What both patterns above need: sentence punctuation right before a quote adept,
+# optionally with pause punctuation in between
+_PUNCTUATION_BEFORE_QUOTES_PATTERN = re.compile(
+    rf"{_SENTENCE_PUNCTUATION_MARK}"
+    rf"{_PAUSE_PUNCTUATION_MARK}?"
+    rf"(?:{DOUBLE_QUOTE_ADEPTS})"
+)
+
+# {quote} content {number}{quote}{punct}, swapped so the closing quote is not taken for inches
+_QUOTED_NUMBER_BEFORE_PUNCTUATION_PATTERN = re.compile(
+    rf"([^0-9]|^)"
+    rf"({DOUBLE_QUOTE_ADEPTS})"
+    rf"(.+?)"
+    rf"(\d+)"
+    rf"({DOUBLE_QUOTE_ADEPTS})"
+    rf"({_TERMINAL_PUNCTUATION_MARK})"
+)
+
+# Probe for the double prime steps, which both need a digit
+_DIGIT_PATTERN = re.compile(r"\d")
+
+# Inches following a number (1-3 digits + optional space + quote adept)
+_DOUBLE_PRIME_PATTERN = re.compile(
+    rf"(\b\d{{1,3}})"
+    rf"({_SPACE}?)"
+    rf"({DOUBLE_QUOTE_ADEPTS})"
+    rf"({_NOT_LETTER}|\B)"
+)
+
+# Quotes around a number already identified as inches
+_QUOTED_NUMBER_PATTERN = re.compile(
+    rf"({DOUBLE_QUOTE_ADEPTS})"
+    rf"(\d+)"
+    rf"({_DOUBLE_PRIME_LABEL})"
+)
+
+_DOUBLE_QUOTE_PAIR_PATTERN = re.compile(
+    rf"({DOUBLE_QUOTE_ADEPTS})"
+    rf"(.*?)"
+    rf"({DOUBLE_QUOTE_ADEPTS})"
+)
+
+_UNPAIRED_LEFT_DOUBLE_QUOTE_PATTERN = re.compile(
+    rf"({DOUBLE_QUOTE_ADEPTS})"
+    rf"([0-9{LOWERCASE_CHARS}{UPPERCASE_CHARS}])"
+)
+
+_UNPAIRED_RIGHT_DOUBLE_QUOTE_PATTERN = re.compile(
+    rf"([{LOWERCASE_CHARS}{UPPERCASE_CHARS}{SENTENCE_PUNCTUATION}{ELLIPSIS}])"
+    rf"({DOUBLE_QUOTE_ADEPTS})"
+)
+
+_UNIDENTIFIED_DOUBLE_QUOTE_PATTERN = re.compile(
+    rf"({_SPACE})"
+    rf"({DOUBLE_QUOTE_ADEPTS})"
+    rf"({_SPACE})"
+)
+
+# Unpaired left quote + content + double prime
+_UNPAIRED_LEFT_QUOTE_AND_DOUBLE_PRIME_PATTERN = re.compile(
+    rf"({_UNPAIRED_LEFT_DOUBLE_QUOTE_LABEL})"
+    rf"(.*?)"
+    rf"({_DOUBLE_PRIME_LABEL})"
+)
+
+# Double prime + content + unpaired right quote
+_DOUBLE_PRIME_AND_UNPAIRED_RIGHT_QUOTE_PATTERN = re.compile(
+    rf"({_DOUBLE_PRIME_LABEL})"
+    rf"(.*?)"
+    rf"({_UNPAIRED_RIGHT_DOUBLE_QUOTE_LABEL})"
+)
+
+# All temporary labels
+_DOUBLE_QUOTE_LABEL_PATTERN = re.compile(f"[{_DOUBLE_PRIME_LABEL}-{_UNPAIRED_RIGHT_DOUBLE_QUOTE_LABEL}]")
 
-def _get_locale(locale):
-    """Convert locale string to Locale instance if needed."""
-    if isinstance(locale, str):
-        return Locale(locale)
-    return locale
+_ROMAN_NUMERAL_PATTERN = re.compile(_ROMAN_NUMERAL)
+
+
+@cache
+def _build_patterns(locale_id):
+    """Compiled locale-dependent patterns, paired with their replacements where those are fixed."""
+    loc = get_locale(locale_id)
+    left_quote = re.escape(loc.double_quote_open)
+    right_quote = re.escape(loc.double_quote_close)
+
+    # Direct speech intro character based on locale
+    # directSpeechIntroAdepts is dynamically collected from all locales in JS:
+    # "," from en-us, ":" from others = ",:"
+    if loc.locale_id == "en-us":
+        direct_speech_intro = ","
+        direct_speech_intro_adepts = r",:"
+    else:
+        direct_speech_intro = ":"
+        direct_speech_intro_adepts = r",:"
+
+    label_replacements = {
+        _DOUBLE_PRIME_LABEL: DOUBLE_PRIME,
+        _LEFT_DOUBLE_QUOTE_LABEL: loc.double_quote_open,
+        _UNPAIRED_LEFT_DOUBLE_QUOTE_LABEL: loc.double_quote_open,
+        _RIGHT_DOUBLE_QUOTE_LABEL: loc.double_quote_close,
+        _UNPAIRED_RIGHT_DOUBLE_QUOTE_LABEL: loc.double_quote_close,
+    }
+
+    # Left quote up to the first right quote past it, within a line. The same as
+    # [{left_quote}].+?[{right_quote}] at the end of a pattern, without the lazy backtracking
+    quoted_speech = rf"({left_quote}.[^{right_quote}\n]*{right_quote})"
+
+    def replace_label(match):
+        return label_replacements[match[0]]
+
+    return {
+        # Temporary labels to double prime and locale quotes
+        "labels": (_DOUBLE_QUOTE_LABEL_PATTERN, replace_label),
+        # Remove space after left quote, and before right quote or double prime
+        "spaces_around_quotes": (
+            re.compile(rf"{_SPACE}(?:(?<={left_quote}{_SPACE})|(?=[{right_quote}{DOUBLE_PRIME}]))"),
+            "",
+        ),
+        # Add space before left quote when preceded by letter or sentence punctuation
+        "missing_space_before_left_quote": (
+            re.compile(rf"([{SENTENCE_PUNCTUATION}{ALL_CHARS}])([{left_quote}])"),
+            r"\1 \2",
+        ),
+        # Add space after right quote when followed by letter
+        "missing_space_after_right_quote": (re.compile(rf"([{right_quote}])({_LETTER})"), r"\1 \2"),
+        # Match: left-quote + non-space-non-quote + not-roman-not-punct + sentence-punct(1+) + right-quote
+        "quoted_word_punctuation": re.compile(
+            rf"({left_quote})"
+            rf"([^{SPACES}{right_quote}]+?)"
+            rf"([^{ROMAN_NUMERALS}{SENTENCE_PUNCTUATION}])"
+            rf"({_SENTENCE_PUNCTUATION_MARK}{{1,}})"
+            rf"({right_quote})"
+        ),
+        # Pieces of the move-punctuation-inside step, see _move_punctuation_inside_quotes
+        "punctuation_inside_quotes": (
+            loc.double_quote_open,
+            # Right quote followed by sentence punctuation
+            re.compile(rf"{right_quote}(?=[{SENTENCE_PUNCTUATION}{ELLIPSIS}])"),
+        ),
+        # Move colons and semicolons outside
+        "punctuation_outside_quotes": (re.compile(rf"([:;])({right_quote})"), r"\2\1"),
+        "direct_speech_intro": (
+            # 1. Consolidate dashes to direct speech intro
+            (
+                re.compile(
+                    rf"({_LETTER})"
+                    rf"[{direct_speech_intro_adepts}]?"
+                    rf"{_SPACE}*"
+                    rf"{_DASH}"
+                    rf"{_SPACE}*"
+                    rf"{quoted_speech}"
+                ),
+                rf"\1{direct_speech_intro} \2",
+            ),
+            # 2. Fix extra spacing between direct speech intro and opening quotes
+            (
+                re.compile(
+                    rf"({_LETTER})"
+                    rf"[{direct_speech_intro_adepts}]"
+                    rf"{_SPACE}*"
+                    rf"{quoted_speech}"
+                ),
+                rf"\1{direct_speech_intro} \2",
+            ),
+        ),
+        # 3. Remove trailing dashes after closing quotes, see _remove_dash_after_quoted_speech
+        "dash_after_quoted_speech": (
+            loc.double_quote_open,
+            # Right quote + dash + the letter after it
+            re.compile(
+                rf"{right_quote}"
+                rf"{_SPACE}*"
+                rf"{_DASH}"
+                rf"{_SPACE}*"
+                rf"({_LETTER})"
+            ),
+        ),
+        "dash_before_quoted_speech": (
+            # 4. At paragraph start, remove dashes before opening quotes
+            (
+                re.compile(
+                    rf"^"
+                    rf"{_SPACE}*"
+                    rf"{_DASH}"
+                    rf"{_SPACE}*"
+                    rf"{quoted_speech}"
+                ),
+                r"\1",
+            ),
+            # 5. After terminal punctuation, remove dashes before opening quotes
+            (
+                re.compile(
+                    rf"({_TERMINAL_PUNCTUATION_MARK})"
+                    rf"{_SPACE}+"
+                    rf"{_DASH}"
+                    rf"{_SPACE}*"
+                    rf"{quoted_speech}"
+                ),
+                r"\1 \2",
+            ),
+        ),
+    }
 
 
 def remove_extra_punctuation_before_quotes(text, locale):
@@ -66,15 +308,8 @@ def remove_extra_punctuation_before_quotes(text, locale):
     Exceptions:
         (cs/sk) Byl to "Karel IV.", ktery - preserves roman numeral pattern
     """
-    # Match: not-roman-numeral + sentence-punct + pause-punct + quote-adept
     # Removes the pause punctuation
-    pattern = re.compile(
-        rf"([^{ROMAN_NUMERALS}])"
-        rf"([{SENTENCE_PUNCTUATION}])"
-        rf"([{SENTENCE_PAUSE_PUNCTUATION}])"
-        rf"({DOUBLE_QUOTE_ADEPTS})"
-    )
-    return pattern.sub(r"\1\2\4", text)
+    return _EXTRA_PUNCTUATION_BEFORE_QUOTES_PATTERN.sub(r"\1\2\4", text)
 
 
 def remove_extra_punctuation_after_quotes(text, locale):
@@ -87,15 +322,8 @@ def remove_extra_punctuation_after_quotes(text, locale):
     Exceptions:
         (cs/sk) Byl to "Karel IV.", ktery - preserves roman numeral pattern
     """
-    # Match: not-roman-numeral + sentence-punct + quote-adept + sentence-punct
     # Removes the trailing punctuation
-    pattern = re.compile(
-        rf"([^{ROMAN_NUMERALS}])"
-        rf"([{SENTENCE_PUNCTUATION}])"
-        rf"({DOUBLE_QUOTE_ADEPTS})"
-        rf"([{SENTENCE_PUNCTUATION}])"
-    )
-    return pattern.sub(r"\1\2\3", text)
+    return _EXTRA_PUNCTUATION_AFTER_QUOTES_PATTERN.sub(r"\1\2\3", text)
 
 
 def identify_double_primes(text, locale):
@@ -107,30 +335,21 @@ def identify_double_primes(text, locale):
     [2] Identify inches following a number as double prime
 
     Example:
-        12' 45" -> 12' 45{{typopo__double-prime}}
+        12' 45" -> 12' 45{double-prime label}
     """
+    # Both steps need a digit (any Unicode one, like \d), and a single search is far
+    # cheaper than step [1], which is tried at every position
+    if not _DIGIT_PATTERN.search(text):
+        return text
+
     # [1] Swap quote adepts so they're not identified as double prime
     # Pattern: {quote} content {number}{quote}{punct} -> {quote} content {number}{punct}{quote}
-    pattern1 = re.compile(
-        rf"([^0-9]|^)"
-        rf"({DOUBLE_QUOTE_ADEPTS})"
-        rf"(.+?)"
-        rf"(\d+)"
-        rf"({DOUBLE_QUOTE_ADEPTS})"
-        rf"([{TERMINAL_PUNCTUATION}{ELLIPSIS}])"
-    )
-    text = pattern1.sub(r"\1\2\3\4\6\5", text)
+    text = _QUOTED_NUMBER_BEFORE_PUNCTUATION_PATTERN.sub(r"\1\2\3\4\6\5", text)
 
     # [2] Identify inches following a number (1-3 digits + optional space + quote adept)
     # The trailing group ensures we don't match opening quotes before words
     # (e.g. 'Level 3 "with"' — the " before "with" is a quote, not inches)
-    pattern2 = re.compile(
-        rf"(\b\d{{1,3}})"
-        rf"([{SPACES}]?)"
-        rf"({DOUBLE_QUOTE_ADEPTS})"
-        rf"([^{ALL_CHARS}]|\B)"
-    )
-    text = pattern2.sub(r"\1\2{{typopo__double-prime}}\4", text)
+    text = _DOUBLE_PRIME_PATTERN.sub(rf"\1\2{_DOUBLE_PRIME_LABEL}\4", text)
 
     return text
 
@@ -140,25 +359,15 @@ def identify_double_quote_pairs(text, locale):
     Identify double quote pairs.
 
     Example:
-        "quoted material" -> {{typopo__ldq}}quoted material{{typopo__rdq}}
+        "quoted material" -> {ldq label}quoted material{rdq label}
 
     Assumes double primes have been identified in previous run.
     """
     # Handle quotes around a number (to avoid confusion with primes)
-    pattern1 = re.compile(
-        rf"({DOUBLE_QUOTE_ADEPTS})"
-        rf"(\d+)"
-        rf"(\{{\{{typopo__double-prime\}}\}})"
-    )
-    text = pattern1.sub(r"{{typopo__ldq}}\2{{typopo__rdq}}", text)
+    text = _QUOTED_NUMBER_PATTERN.sub(rf"{_LEFT_DOUBLE_QUOTE_LABEL}\2{_RIGHT_DOUBLE_QUOTE_LABEL}", text)
 
     # Generic rule: match any quote pair
-    pattern2 = re.compile(
-        rf"({DOUBLE_QUOTE_ADEPTS})"
-        rf"(.*?)"
-        rf"({DOUBLE_QUOTE_ADEPTS})"
-    )
-    text = pattern2.sub(r"{{typopo__ldq}}\2{{typopo__rdq}}", text)
+    text = _DOUBLE_QUOTE_PAIR_PATTERN.sub(rf"{_LEFT_DOUBLE_QUOTE_LABEL}\2{_RIGHT_DOUBLE_QUOTE_LABEL}", text)
 
     return text
 
@@ -168,13 +377,9 @@ def identify_unpaired_left_double_quote(text, locale):
     Identify unpaired left double quotes (followed by letter/number).
 
     Example:
-        "unpaired left quote. -> {{typopo__ldq--unpaired}}unpaired left quote.
+        "unpaired left quote. -> {unpaired ldq label}unpaired left quote.
     """
-    pattern = re.compile(
-        rf"({DOUBLE_QUOTE_ADEPTS})"
-        rf"([0-9{LOWERCASE_CHARS}{UPPERCASE_CHARS}])"
-    )
-    return pattern.sub(r"{{typopo__ldq--unpaired}}\2", text)
+    return _UNPAIRED_LEFT_DOUBLE_QUOTE_PATTERN.sub(rf"{_UNPAIRED_LEFT_DOUBLE_QUOTE_LABEL}\2", text)
 
 
 def identify_unpaired_right_double_quote(text, locale):
@@ -182,13 +387,9 @@ def identify_unpaired_right_double_quote(text, locale):
     Identify unpaired right double quotes (preceded by letter/punctuation).
 
     Example:
-        unpaired" right -> unpaired{{typopo__rdq--unpaired}} right
+        unpaired" right -> unpaired{unpaired rdq label} right
     """
-    pattern = re.compile(
-        rf"([{LOWERCASE_CHARS}{UPPERCASE_CHARS}{SENTENCE_PUNCTUATION}{ELLIPSIS}])"
-        rf"({DOUBLE_QUOTE_ADEPTS})"
-    )
-    return pattern.sub(r"\1{{typopo__rdq--unpaired}}", text)
+    return _UNPAIRED_RIGHT_DOUBLE_QUOTE_PATTERN.sub(rf"\1{_UNPAIRED_RIGHT_DOUBLE_QUOTE_LABEL}", text)
 
 
 def remove_unidentified_double_quote(text, locale):
@@ -198,12 +399,7 @@ def remove_unidentified_double_quote(text, locale):
     Example:
         word " word -> word word
     """
-    pattern = re.compile(
-        rf"([{SPACES}])"
-        rf"({DOUBLE_QUOTE_ADEPTS})"
-        rf"([{SPACES}])"
-    )
-    return pattern.sub(r"\1", text)
+    return _UNIDENTIFIED_DOUBLE_QUOTE_PATTERN.sub(r"\1", text)
 
 
 def replace_double_prime_with_double_quote(text, locale):
@@ -213,20 +409,14 @@ def replace_double_prime_with_double_quote(text, locale):
     Handles cases like "Localhost 3000" where number looks like inches.
     """
     # Pattern: unpaired-left + content + double-prime -> quote pair
-    pattern1 = re.compile(
-        r"(\{\{typopo__ldq--unpaired\}\})"
-        r"(.*?)"
-        r"(\{\{typopo__double-prime\}\})"
+    text = _UNPAIRED_LEFT_QUOTE_AND_DOUBLE_PRIME_PATTERN.sub(
+        rf"{_LEFT_DOUBLE_QUOTE_LABEL}\2{_RIGHT_DOUBLE_QUOTE_LABEL}", text
     )
-    text = pattern1.sub(r"{{typopo__ldq}}\2{{typopo__rdq}}", text)
 
     # Pattern: double-prime + content + unpaired-right -> quote pair
-    pattern2 = re.compile(
-        r"(\{\{typopo__double-prime\}\})"
-        r"(.*?)"
-        r"(\{\{typopo__rdq--unpaired\}\})"
+    text = _DOUBLE_PRIME_AND_UNPAIRED_RIGHT_QUOTE_PATTERN.sub(
+        rf"{_LEFT_DOUBLE_QUOTE_LABEL}\2{_RIGHT_DOUBLE_QUOTE_LABEL}", text
     )
-    text = pattern2.sub(r"{{typopo__ldq}}\2{{typopo__rdq}}", text)
 
     return text
 
@@ -235,16 +425,18 @@ def place_locale_double_quotes(text, locale):
     """
     Replace temporary labels with locale-specific quotes.
 
-    Converts {{typopo__double-prime}} to actual double prime character,
-    and {{typopo__ldq}}/{{typopo__rdq}} to locale quotes.
+    Converts the double-prime label to actual double prime character,
+    and the (unpaired) left/right quote labels to locale quotes.
     """
-    loc = _get_locale(locale)
+    # The labels are non-ASCII, and str.isascii() is a constant-time flag check
+    if text.isascii():
+        return text
 
-    text = text.replace("{{typopo__double-prime}}", DOUBLE_PRIME)
-    text = re.sub(r"(\{\{typopo__ldq\}\}|\{\{typopo__ldq--unpaired\}\})", loc.double_quote_open, text)
-    text = re.sub(r"(\{\{typopo__rdq\}\}|\{\{typopo__rdq--unpaired\}\})", loc.double_quote_close, text)
-
-    return text
+    # One pass over the text for all three kinds of label.
+    # A regex sub beats str.translate here: translate looks up every character
+    # of non-ASCII text in the table, while the sub only stops at labels.
+    pattern, replacement = _build_patterns(get_locale(locale).locale_id)["labels"]
+    return pattern.sub(replacement, text)
 
 
 def remove_extra_spaces_around_quotes(text, locale):
@@ -255,23 +447,10 @@ def remove_extra_spaces_around_quotes(text, locale):
         " English " -> "English"
         12' 45 " -> 12' 45"
     """
-    loc = _get_locale(locale)
-    left_quote = re.escape(loc.double_quote_open)
-    right_quote = re.escape(loc.double_quote_close)
-
-    # Remove space after left quote
-    pattern1 = re.compile(rf"({left_quote})([{SPACES}])")
-    text = pattern1.sub(r"\1", text)
-
-    # Remove space before right quote
-    pattern2 = re.compile(rf"([{SPACES}])({right_quote})")
-    text = pattern2.sub(r"\2", text)
-
-    # Remove space before double prime
-    pattern3 = re.compile(rf"([{SPACES}])({re.escape(DOUBLE_PRIME)})")
-    text = pattern3.sub(r"\2", text)
-
-    return text
+    # One pass for all three, each removing a single space; removing a space never
+    # creates a match for the others, so this is the same as running them in sequence
+    pattern, replacement = _build_patterns(get_locale(locale).locale_id)["spaces_around_quotes"]
+    return pattern.sub(replacement, text)
 
 
 def add_space_before_left_double_quote(text, locale):
@@ -283,12 +462,11 @@ def add_space_before_left_double_quote(text, locale):
 
     Also applies nbsp after preposition rule.
     """
-    loc = _get_locale(locale)
-    left_quote = re.escape(loc.double_quote_open)
+    loc = get_locale(locale)
 
     # Add space before left quote when preceded by letter or sentence punctuation
-    pattern = re.compile(rf"([{SENTENCE_PUNCTUATION}{ALL_CHARS}])([{left_quote}])")
-    text = pattern.sub(r"\1 \2", text)
+    pattern, replacement = _build_patterns(loc.locale_id)["missing_space_before_left_quote"]
+    text = pattern.sub(replacement, text)
 
     # Apply nbsp after preposition rule
     text = add_nbsp_after_preposition(text, loc)
@@ -303,12 +481,9 @@ def add_space_after_right_double_quote(text, locale):
     Example:
         It's a "nice"saying. -> It's a "nice" saying.
     """
-    loc = _get_locale(locale)
-    right_quote = re.escape(loc.double_quote_close)
-
     # Add space after right quote when followed by letter
-    pattern = re.compile(rf"([{right_quote}])([{ALL_CHARS}])")
-    return pattern.sub(r"\1 \2", text)
+    pattern, replacement = _build_patterns(get_locale(locale).locale_id)["missing_space_after_right_quote"]
+    return pattern.sub(replacement, text)
 
 
 def fix_quoted_word_punctuation(text, locale):
@@ -328,18 +503,7 @@ def fix_quoted_word_punctuation(text, locale):
         "2020:" -> "2020":
         "Wow!" -> "Wow!" (unchanged—ambiguous)
     """
-    loc = _get_locale(locale)
-    left_quote = re.escape(loc.double_quote_open)
-    right_quote = re.escape(loc.double_quote_close)
-
-    # Match: left-quote + non-space-non-quote + not-roman-not-punct + sentence-punct(1+) + right-quote
-    pattern = re.compile(
-        rf"({left_quote})"
-        rf"([^{SPACES}{right_quote}]+?)"
-        rf"([^{ROMAN_NUMERALS}{SENTENCE_PUNCTUATION}])"
-        rf"([{SENTENCE_PUNCTUATION}]{{1,}})"
-        rf"({right_quote})"
-    )
+    pattern = _build_patterns(get_locale(locale).locale_id)["quoted_word_punctuation"]
 
     def replacer(match):
         left_q, content, not_roman, punct, right_q = match.groups()
@@ -351,6 +515,86 @@ def fix_quoted_word_punctuation(text, locale):
     return pattern.sub(replacer, text)
 
 
+def _move_punctuation_inside_quotes(text, left_quote, right_quote_pattern):
+    """
+    Swap a right quote and the sentence punctuation after it, for quoted sentences.
+
+    Same result as substituting r"\1\2\3\4\6\5" for the typopo pattern
+        (left-quote)(.+)(space)(?!left-quote)([^roman]{2,})(right-quote)(sentence-punct)
+    without its backtracking, which is cubic in the length of a line with
+    unclosed quotes. For a match starting at a left quote, the regex engine
+    settles on the last space on that line from which a run of at least two
+    non-roman characters reaches a right quote + punctuation, and on the last
+    such right quote. Neither depends on where on the line the match starts,
+    so they are looked up once per line.
+    """
+    if left_quote not in text:
+        return text
+
+    # Right quotes followed by punctuation, in order
+    right_quotes = [match.start() for match in right_quote_pattern.finditer(text)]
+    if not right_quotes:
+        return text
+
+    # Runs of non-roman characters, as (position before the run, last right quote in the run)
+    roman_positions = [match.start() for match in _ROMAN_NUMERAL_PATTERN.finditer(text)]
+    text_length = len(text)
+    run_starts = []
+    run_right_quotes = []
+    for index, right_quote in enumerate(right_quotes):
+        roman_index = bisect_left(roman_positions, right_quote)
+        run_end = roman_positions[roman_index] if roman_index < len(roman_positions) else text_length
+        if index + 1 < len(right_quotes) and right_quotes[index + 1] < run_end:
+            continue
+        run_starts.append(roman_positions[roman_index - 1] if roman_index else -1)
+        run_right_quotes.append(right_quote)
+
+    def find_last_space(line_start, line_end):
+        """Last usable space on the line, with the right quote it leads to."""
+        for index in range(bisect_left(run_starts, line_end) - 1, -1, -1):
+            right_quote = run_right_quotes[index]
+            if right_quote - 3 <= line_start:
+                break
+            low = max(run_starts[index], line_start)
+            high = min(right_quote - 3, line_end - 1)
+            while high > low:
+                space = max(text.rfind(char, low + 1, high + 1) for char in SPACES)
+                if space == -1:
+                    break
+                # The space must not be followed by a left quote
+                if text.startswith(left_quote, space + 1):
+                    high = space - 1
+                    continue
+                return space, right_quote
+        return None
+
+    parts = []
+    position = 0
+    line_end = -1
+    start = text.find(left_quote)
+    while start != -1:
+        # ".+" cannot cross the end of the line
+        if start > line_end:
+            line_end = text.find("\n", start + 1)
+            if line_end == -1:
+                line_end = text_length
+            last_space = find_last_space(text.rfind("\n", 0, line_end), line_end)
+        if last_space is not None and last_space[0] >= start + 2:
+            right_quote = last_space[1]
+            parts.append(text[position:right_quote])
+            parts.append(text[right_quote + 1])
+            parts.append(text[right_quote])
+            position = right_quote + 2
+            start = text.find(left_quote, position)
+        else:
+            start = text.find(left_quote, start + 1)
+
+    if not parts:
+        return text
+    parts.append(text[position:])
+    return "".join(parts)
+
+
 def fix_quoted_sentence_punctuation(text, locale):
     """
     Fix punctuation placement for quoted sentence or fragment of words.
@@ -359,27 +603,55 @@ def fix_quoted_sentence_punctuation(text, locale):
     - move periods `.`, commas `,`, ellipses `…`, exclamation `!` and question marks `?` inside the quoted part
     - move colons `:` and semicolons `;` outside the quoted part
     """
-    loc = _get_locale(locale)
-    left_quote = re.escape(loc.double_quote_open)
-    right_quote = re.escape(loc.double_quote_close)
+    patterns = _build_patterns(get_locale(locale).locale_id)
 
     # Step 1: Move everything inside
-    # Match: left-quote + content + space + (not looking ahead at left-quote) + not-roman(2+) + right-quote + sentence-punct
-    pattern1 = re.compile(
-        rf"({left_quote})"
-        rf"(.+)"
-        rf"([{SPACES}])(?!{left_quote})"
-        rf"([^{ROMAN_NUMERALS}]{{2,}})"
-        rf"({right_quote})"
-        rf"([{SENTENCE_PUNCTUATION}{ELLIPSIS}])"
-    )
-    text = pattern1.sub(r"\1\2\3\4\6\5", text)
+    text = _move_punctuation_inside_quotes(text, *patterns["punctuation_inside_quotes"])
 
     # Step 2: Move colons and semicolons outside
-    pattern2 = re.compile(rf"([:;])({right_quote})")
-    text = pattern2.sub(r"\2\1", text)
-
-    return text
+    pattern, replacement = patterns["punctuation_outside_quotes"]
+    return pattern.sub(replacement, text)
+
+
+def _remove_dash_after_quoted_speech(text, left_quote, dash_pattern):
+    """
+    Remove the dash between quoted speech and the word that follows it.
+
+    Same result as substituting r"\1 \2" for the typopo pattern
+        ([left-quote].+?[right-quote])(space)*(dash)(space)*(letter)
+    without retrying every right quote up to the end of the line from each left
+    quote, which is quadratic on a line of unclosed quotes. The match from a left
+    quote ends at the first right quote + dash at least two characters on; when
+    that is past the end of the line, every later left quote on the line fails too.
+    """
+    parts = []
+    position = 0
+    dash = None
+    line_end = -1
+    start = text.find(left_quote)
+    while start != -1:
+        if dash is None or dash.start() < start + 2:
+            dash = dash_pattern.search(text, start + 2)
+            if dash is None:
+                break
+        # ".+?" cannot cross the end of the line
+        if start >= line_end:
+            line_end = text.find("\n", start + 1)
+            if line_end == -1:
+                line_end = len(text)
+        if dash.start() < line_end:
+            parts.append(text[position : dash.start() + 1])
+            parts.append(" ")
+            parts.append(dash[1])
+            position = dash.end()
+            start = text.find(left_quote, position)
+        else:
+            start = text.find(left_quote, line_end)
+
+    if not parts:
+        return text
+    parts.append(text[position:])
+    return "".join(parts)
 
 
 def fix_direct_speech_intro(text, locale):
@@ -392,75 +664,47 @@ def fix_direct_speech_intro(text, locale):
 
     Also removes trailing dashes after closing quotes.
     """
-    loc = _get_locale(locale)
-    left_quote = re.escape(loc.double_quote_open)
-    right_quote = re.escape(loc.double_quote_close)
+    # The five steps run in order; see _build_patterns for each one
+    patterns = _build_patterns(get_locale(locale).locale_id)
 
-    # Direct speech intro character based on locale
-    # directSpeechIntroAdepts is dynamically collected from all locales in JS:
-    # "," from en-us, ":" from others = ",:"
-    if loc.locale_id == "en-us":
-        direct_speech_intro = ","
-        direct_speech_intro_adepts = r",:"
-    else:
-        direct_speech_intro = ":"
-        direct_speech_intro_adepts = r",:"
+    # Step 2 is the only one that matches without a dash, and none of them adds a dash
+    if HYPHEN not in text and EN_DASH not in text and EM_DASH not in text:
+        pattern, replacement = patterns["direct_speech_intro"][1]
+        return pattern.sub(replacement, text)
 
-    dashes = f"{HYPHEN}{EN_DASH}{EM_DASH}"
+    for pattern, replacement in patterns["direct_speech_intro"]:
+        text = pattern.sub(replacement, text)
 
-    # 1. Consolidate dashes to direct speech intro
-    pattern1 = re.compile(
-        rf"([{ALL_CHARS}])"
-        rf"[{direct_speech_intro_adepts}]?"
-        rf"[{SPACES}]*"
-        rf"[{dashes}]"
-        rf"[{SPACES}]*"
-        rf"([{left_quote}].+?[{right_quote}])"
-    )
-    text = pattern1.sub(rf"\1{direct_speech_intro} \2", text)
-
-    # 2. Fix extra spacing between direct speech intro and opening quotes
-    pattern2 = re.compile(
-        rf"([{ALL_CHARS}])"
-        rf"[{direct_speech_intro_adepts}]"
-        rf"[{SPACES}]*"
-        rf"([{left_quote}].+?[{right_quote}])"
-    )
-    text = pattern2.sub(rf"\1{direct_speech_intro} \2", text)
-
-    # 3. Remove trailing dashes after closing quotes
-    pattern3 = re.compile(
-        rf"([{left_quote}].+?[{right_quote}])"
-        rf"[{SPACES}]*"
-        rf"[{dashes}]"
-        rf"[{SPACES}]*"
-        rf"([{ALL_CHARS}])"
-    )
-    text = pattern3.sub(r"\1 \2", text)
-
-    # 4. At paragraph start, remove dashes before opening quotes
-    pattern4 = re.compile(
-        rf"^"
-        rf"[{SPACES}]*"
-        rf"[{dashes}]"
-        rf"[{SPACES}]*"
-        rf"([{left_quote}].+?[{right_quote}])"
-    )
-    text = pattern4.sub(r"\1", text)
-
-    # 5. After terminal punctuation, remove dashes before opening quotes
-    pattern5 = re.compile(
-        rf"([{TERMINAL_PUNCTUATION}{ELLIPSIS}])"
-        rf"[{SPACES}]+"
-        rf"[{dashes}]"
-        rf"[{SPACES}]*"
-        rf"([{left_quote}].+?[{right_quote}])"
-    )
-    text = pattern5.sub(r"\1 \2", text)
+    text = _remove_dash_after_quoted_speech(text, *patterns["dash_after_quoted_speech"])
+
+    for pattern, replacement in patterns["dash_before_quoted_speech"]:
+        text = pattern.sub(replacement, text)
 
     return text
 
 
+def _escape_labels(text):
+    """
+    Swap label code points already present in the text for unused private-use ones.
+
+    The labels are private-use characters, which icon fonts and vendors also use.
+    Their stand-ins come from Supplementary Private Use Area-A: characters of the
+    same category, so every pattern treats them the same, but not labels.
+
+    Returns:
+        The escaped text and the str.translate table that restores the originals
+    """
+    for base in range(0xF0000, 0xFFFFA, 5):
+        stand_ins = [chr(base + offset) for offset in range(5)]
+        if not any(stand_in in text for stand_in in stand_ins):
+            break
+
+    labels = [chr(code) for code in range(ord(_DOUBLE_PRIME_LABEL), ord(_UNPAIRED_RIGHT_DOUBLE_QUOTE_LABEL) + 1)]
+    escape = str.maketrans(dict(zip(labels, stand_ins, strict=True)))
+    restore = str.maketrans(dict(zip(stand_ins, labels, strict=True)))
+    return text.translate(escape), restore
+
+
 def fix_double_quotes_and_primes(text, locale):
     """
     Correct improper use of double quotes and double primes.
@@ -483,11 +727,25 @@ def fix_double_quotes_and_primes(text, locale):
     Returns:
         Text with proper double quotes and primes
     """
-    loc = _get_locale(locale)
+    loc = get_locale(locale)
+
+    # Every step rewrites or needs a quote adept, except the nbsp after preposition
+    # rule applied along with [7]; text without an adept only gets that rule
+    if not _DOUBLE_QUOTE_ADEPT_PATTERN.search(text):
+        return add_nbsp_after_preposition(text, loc)
+
+    # Label code points in the input must come out as they went in, not as quotes
+    restore_labels = None
+    if _DOUBLE_QUOTE_LABEL_PATTERN.search(text):
+        text, restore_labels = _escape_labels(text)
 
     # [1] Remove extra terminal punctuation around double quotes
-    text = remove_extra_punctuation_before_quotes(text, loc)
-    text = remove_extra_punctuation_after_quotes(text, loc)
+    # Without punctuation before a quote adept neither step can match, and one search
+    # is cheaper than two full substitutions (a fused single pass is not equivalent:
+    # removing punctuation before a quote can expose new matches for the second step)
+    if _PUNCTUATION_BEFORE_QUOTES_PATTERN.search(text):
+        text = remove_extra_punctuation_before_quotes(text, loc)
+        text = remove_extra_punctuation_after_quotes(text, loc)
 
     # [2] Identify inches, arcseconds, seconds
     text = identify_double_primes(text, loc)
@@ -496,15 +754,19 @@ def fix_double_quotes_and_primes(text, locale):
     text = identify_double_quote_pairs(text, loc)
 
     # [4] Identify unpaired double quotes
-    text = identify_unpaired_left_double_quote(text, loc)
-    text = identify_unpaired_right_double_quote(text, loc)
-    text = remove_unidentified_double_quote(text, loc)
+    # All three need a quote adept, and once every quote is paired or a prime there is none left
+    if _DOUBLE_QUOTE_ADEPT_PATTERN.search(text):
+        text = identify_unpaired_left_double_quote(text, loc)
+        text = identify_unpaired_right_double_quote(text, loc)
+        text = remove_unidentified_double_quote(text, loc)
 
     # [5] Replace double quote & double prime with quote pair
     text = replace_double_prime_with_double_quote(text, loc)
 
     # [6] Replace all identified punctuation with locale quotes
     text = place_locale_double_quotes(text, loc)
+    if restore_labels:
+        text = text.translate(restore_labels)
 
     # [7] Consolidate spaces around quotes and primes
     text = remove_extra_spaces_around_quotes(text, loc)
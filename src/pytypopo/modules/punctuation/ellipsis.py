@@ -10,6 +10,7 @@ Handles:
 """
 
 import re
+from functools import cache
 
 from pytypopo.const import (
     ALL_CHARS,
@@ -23,6 +24,110 @@ from pytypopo.const import (
 )
 from pytypopo.locale import get_locale
 
+# Character-class fragments shared by the patterns below, built once at import
+_LETTER = f"[{ALL_CHARS}]"
+_SPACE = f"[{SPACES}]"
+_LOWERCASE_LETTER = f"[{LOWERCASE_CHARS}]"
+_UPPERCASE_LETTER = f"[{UPPERCASE_CHARS}]"
+
+# Locale-independent patterns, compiled once at import.
+# Locale-dependent ones are built per locale in _build_patterns.
+
+# 3 or more periods and/or ellipsis characters
+_THREE_CHARS_PATTERN = re.compile(rf"[{ELLIPSIS}\.]{{3,}}")
+
+# Period+ellipsis, multiple ellipses, ellipsis+period
+_TWO_CHARS_PATTERN = re.compile(
+    rf"\.{ELLIPSIS}|"
+    rf"{ELLIPSIS}{{2,}}|"
+    rf"{ELLIPSIS}\."
+)
+
+# Space + two periods + space
+_TWO_PERIODS_PATTERN = re.compile(rf"{_SPACE}\.{{2}}{_SPACE}")
+
+# Comma + optional space + ellipsis + optional space + comma
+_ELLIPSIS_BETWEEN_COMMAS_PATTERN = re.compile(
+    rf"(,)"
+    rf"({_SPACE}?)"
+    rf"({ELLIPSIS})"
+    rf"({_SPACE}?)"
+    rf"(,)"
+)
+
+# Comma + optional space + ellipsis + optional space +
+# (word boundary or closing bracket) + (not comma or end)
+_ELLIPSIS_AS_LAST_ITEM_PATTERN = re.compile(
+    rf"(,)"
+    rf"({_SPACE}?)"
+    rf"({ELLIPSIS})"
+    rf"({_SPACE}?)"
+    rf"(\B|[{CLOSING_BRACKETS}])"
+    rf"([^,]|$)"
+)
+
+# Line start + ellipsis + space + letter
+_APOSIOPESIS_STARTING_PARAGRAPH_PATTERN = re.compile(
+    rf"(^{ELLIPSIS})"
+    rf"({_SPACE})"
+    rf"([{LOWERCASE_CHARS}{UPPERCASE_CHARS}])",
+    re.MULTILINE,
+)
+
+# Lowercase + space + ellipsis + optional space + uppercase
+_APOSIOPESIS_BETWEEN_SENTENCES_PATTERN = re.compile(
+    rf"({_LOWERCASE_LETTER})"
+    rf"({_SPACE})"
+    rf"([{ELLIPSIS}])"
+    rf"({_SPACE}?)"
+    rf"({_UPPERCASE_LETTER})"
+)
+
+# Letter + ellipsis + letter
+_APOSIOPESIS_BETWEEN_WORDS_PATTERN = re.compile(
+    rf"({_LETTER})"
+    rf"([{ELLIPSIS}])"
+    rf"({_LETTER})"
+)
+
+
+@cache
+def _build_patterns(locale_id):
+    """Compiled patterns that depend on the locale's closing quotes."""
+    loc = get_locale(locale_id)
+
+    # Ellipsis optionally followed by closing quote at end
+    closing_quotes = f"[{loc.double_quote_close}{loc.single_quote_close}]"
+
+    return {
+        # Not closing quote + sentence punctuation + optional space +
+        # ellipsis + optional space + lowercase letter
+        "aposiopesis_starting_sentence": re.compile(
+            rf"([^{loc.terminal_quotes}])"
+            rf"([{SENTENCE_PUNCTUATION}])"
+            rf"({_SPACE}?)"
+            rf"([{ELLIPSIS}])"
+            rf"({_SPACE}?)"
+            rf"({_LOWERCASE_LETTER})"
+        ),
+        # Sentence punctuation or closing quote + optional space +
+        # ellipsis + optional space + uppercase letter
+        "ellipsis_between_sentences": re.compile(
+            rf"([{SENTENCE_PUNCTUATION}{loc.terminal_quotes}])"
+            rf"({_SPACE}?)"
+            rf"({ELLIPSIS})"
+            rf"({_SPACE}?)"
+            rf"({_UPPERCASE_LETTER})"
+        ),
+        # Lowercase + spaces + ellipsis (optionally with closing quote) + end
+        "aposiopesis_ending_paragraph": re.compile(
+            rf"({_LOWERCASE_LETTER})"
+            rf"({_SPACE})+"
+            rf"({ELLIPSIS}{closing_quotes}?$)",
+            re.MULTILINE,
+        ),
+    }
+
 
 def replace_three_chars_with_ellipsis(text, locale=None):
     """
@@ -37,9 +142,12 @@ def replace_three_chars_with_ellipsis(text, locale=None):
     Returns:
         Text with three+ periods/ellipses collapsed to single ellipsis
     """
-    # Pattern: 3 or more periods and/or ellipsis characters
-    pattern = re.compile(rf"[{ELLIPSIS}\.]{{3,}}")
-    return pattern.sub(ELLIPSIS, text)
+    # Three such characters in a row include two periods or an ellipsis, and prose
+    # usually has neither; a substring search is far cheaper than the regex scan
+    if ".." not in text and ELLIPSIS not in text:
+        return text
+
+    return _THREE_CHARS_PATTERN.sub(ELLIPSIS, text)
 
 
 def replace_two_chars_with_ellipsis(text, locale=None):
@@ -55,13 +163,7 @@ def replace_two_chars_with_ellipsis(text, locale=None):
     Returns:
         Text with two-char ellipsis combinations collapsed
     """
-    # Pattern: period+ellipsis, multiple ellipses, ellipsis+period
-    pattern = re.compile(
-        rf"\.{ELLIPSIS}|"
-        rf"{ELLIPSIS}{{2,}}|"
-        rf"{ELLIPSIS}\."
-    )
-    return pattern.sub(ELLIPSIS, text)
+    return _TWO_CHARS_PATTERN.sub(ELLIPSIS, text)
 
 
 def replace_two_periods_with_ellipsis(text, locale=None):
@@ -77,9 +179,10 @@ def replace_two_periods_with_ellipsis(text, locale=None):
     Returns:
         Text with spaced double periods converted to ellipsis
     """
-    # Pattern: space + two periods + space
-    pattern = re.compile(rf"[{SPACES}]\.{{2}}[{SPACES}]")
-    return pattern.sub(f"{SPACE}{ELLIPSIS}{SPACE}", text)
+    if ".." not in text:
+        return text
+
+    return _TWO_PERIODS_PATTERN.sub(f"{SPACE}{ELLIPSIS}{SPACE}", text)
 
 
 def fix_ellipsis_spacing_around_commas(text, locale=None):
@@ -95,15 +198,7 @@ def fix_ellipsis_spacing_around_commas(text, locale=None):
     Returns:
         Text with proper spacing around ellipsis in comma contexts
     """
-    # Pattern: comma + optional space + ellipsis + optional space + comma
-    pattern = re.compile(
-        rf"(,)"
-        rf"([{SPACES}]?)"
-        rf"({ELLIPSIS})"
-        rf"([{SPACES}]?)"
-        rf"(,)"
-    )
-    return pattern.sub(rf"\1 {ELLIPSIS}\5", text)
+    return _ELLIPSIS_BETWEEN_COMMAS_PATTERN.sub(rf"\1 {ELLIPSIS}\5", text)
 
 
 def fix_ellipsis_as_last_item(text, locale=None):
@@ -119,17 +214,7 @@ def fix_ellipsis_as_last_item(text, locale=None):
     Returns:
         Text with proper ellipsis as last list item
     """
-    # Pattern: comma + optional space + ellipsis + optional space +
-    # (word boundary or closing bracket) + (not comma or end)
-    pattern = re.compile(
-        rf"(,)"
-        rf"([{SPACES}]?)"
-        rf"({ELLIPSIS})"
-        rf"([{SPACES}]?)"
-        rf"(\B|[{CLOSING_BRACKETS}])"
-        rf"([^,]|$)"
-    )
-    return pattern.sub(r"\1\3\5\6", text)
+    return _ELLIPSIS_AS_LAST_ITEM_PATTERN.sub(r"\1\3\5\6", text)
 
 
 def fix_aposiopesis_starting_paragraph(text, locale=None):
@@ -145,14 +230,7 @@ def fix_aposiopesis_starting_paragraph(text, locale=None):
     Returns:
         Text with proper aposiopesis at paragraph start
     """
-    # Pattern: line start + ellipsis + space + letter
-    pattern = re.compile(
-        rf"(^{ELLIPSIS})"
-        rf"([{SPACES}])"
-        rf"([{LOWERCASE_CHARS}{UPPERCASE_CHARS}])",
-        re.MULTILINE,
-    )
-    return pattern.sub(r"\1\3", text)
+    return _APOSIOPESIS_STARTING_PARAGRAPH_PATTERN.sub(r"\1\3", text)
 
 
 def fix_aposiopesis_starting_sentence(text, locale=None):
@@ -168,18 +246,7 @@ def fix_aposiopesis_starting_sentence(text, locale=None):
     Returns:
         Text with proper aposiopesis after sentence ending
     """
-    loc = get_locale(locale)
-
-    # Pattern: not closing quote + sentence punctuation + optional space +
-    # ellipsis + optional space + lowercase letter
-    pattern = re.compile(
-        rf"([^{loc.terminal_quotes}])"
-        rf"([{SENTENCE_PUNCTUATION}])"
-        rf"([{SPACES}]?)"
-        rf"([{ELLIPSIS}])"
-        rf"([{SPACES}]?)"
-        rf"([{LOWERCASE_CHARS}])"
-    )
+    pattern = _build_patterns(get_locale(locale).locale_id)["aposiopesis_starting_sentence"]
     return pattern.sub(r"\1\2 \4\6", text)
 
 
@@ -196,15 +263,7 @@ def fix_aposiopesis_between_sentences(text, locale=None):
     Returns:
         Text with proper aposiopesis between sentences
     """
-    # Pattern: lowercase + space + ellipsis + optional space + uppercase
-    pattern = re.compile(
-        rf"([{LOWERCASE_CHARS}])"
-        rf"([{SPACES}])"
-        rf"([{ELLIPSIS}])"
-        rf"([{SPACES}]?)"
-        rf"([{UPPERCASE_CHARS}])"
-    )
-    return pattern.sub(r"\1\3 \5", text)
+    return _APOSIOPESIS_BETWEEN_SENTENCES_PATTERN.sub(r"\1\3 \5", text)
 
 
 def fix_aposiopesis_between_words(text, locale=None):
@@ -220,13 +279,7 @@ def fix_aposiopesis_between_words(text, locale=None):
     Returns:
         Text with proper spacing for ellipsis between words
     """
-    # Pattern: letter + ellipsis + letter
-    pattern = re.compile(
-        rf"([{ALL_CHARS}])"
-        rf"([{ELLIPSIS}])"
-        rf"([{ALL_CHARS}])"
-    )
-    return pattern.sub(r"\1\2 \3", text)
+    return _APOSIOPESIS_BETWEEN_WORDS_PATTERN.sub(r"\1\2 \3", text)
 
 
 def fix_ellipsis_between_sentences(text, locale=None):
@@ -242,17 +295,7 @@ def fix_ellipsis_between_sentences(text, locale=None):
     Returns:
         Text with proper ellipsis spacing between sentences
     """
-    loc = get_locale(locale)
-
-    # Pattern: sentence punctuation or closing quote + optional space +
-    # ellipsis + optional space + uppercase letter
-    pattern = re.compile(
-        rf"([{SENTENCE_PUNCTUATION}{loc.terminal_quotes}])"
-        rf"([{SPACES}]?)"
-        rf"({ELLIPSIS})"
-        rf"([{SPACES}]?)"
-        rf"([{UPPERCASE_CHARS}])"
-    )
+    pattern = _build_patterns(get_locale(locale).locale_id)["ellipsis_between_sentences"]
     return pattern.sub(r"\1 \3 \5", text)
 
 
@@ -269,18 +312,7 @@ def fix_aposiopesis_ending_paragraph(text, locale=None):
     Returns:
         Text with proper aposiopesis at paragraph end
     """
-    loc = get_locale(locale)
-
-    # Build pattern for ellipsis optionally followed by closing quote at end
-    closing_quotes = f"[{loc.double_quote_close}{loc.single_quote_close}]"
-
-    # Pattern: lowercase + spaces + ellipsis (optionally with closing quote) + end
-    pattern = re.compile(
-        rf"([{LOWERCASE_CHARS}])"
-        rf"([{SPACES}])+"
-        rf"({ELLIPSIS}{closing_quotes}?$)",
-        re.MULTILINE,
-    )
+    pattern = _build_patterns(get_locale(locale).locale_id)["aposiopesis_ending_paragraph"]
     return pattern.sub(r"\1\3", text)
 
 
@@ -300,6 +332,11 @@ def fix_ellipsis(text, locale=None):
     # First normalize multiple periods/ellipses to single ellipsis
     text = replace_three_chars_with_ellipsis(text, locale)
 
+    # Every later step needs an ellipsis, except the spaced two periods; none of the
+    # steps in between creates one, so text without an ellipsis only needs that step
+    if ELLIPSIS not in text:
+        return replace_two_periods_with_ellipsis(text, locale)
+
     # Fix spacing in specific contexts
     text = fix_ellipsis_spacing_around_commas(text, locale)
     text = fix_ellipsis_as_last_item(text, locale)
@@ -24,6 +24,10 @@ def remove_extra_period(text, locale=None):
     Returns:
         Text with multiple periods collapsed to single period
     """
+    # Most text has no run of periods, and a substring search finds that far faster
+    # than a regex scan
+    if ".." not in text:
+        return text
     return _EXTRA_PERIOD_PATTERN.sub(".", text)
 
 
@@ -12,6 +12,7 @@ Corrects improper use of single quotes, single primes, and apostrophes by:
 """
 
 import re
+from functools import cache
 
 from pytypopo.const import (
     ALL_CHARS,
@@ -28,45 +29,65 @@ from pytypopo.const import (
     SPACES,
     TERMINAL_PUNCTUATION,
 )
-from pytypopo.locale import Locale
+from pytypopo.locale import get_locale
 
 # Single quote adepts - various characters that might represent single quotes/apostrophes
 # Includes: ' (straight), ' ' (curly), ‚ (low-9), ‹ › (single guillemets),
 # ʼ (modifier letter), ‛ (high-reversed-9), ´ (acute), ` (grave), ′ (prime)
+# A character class rather than an alternation, so SRE tests each position with one set lookup
 SINGLE_QUOTE_ADEPTS = (
-    r"\u201a"  # ‚ single low-9 quotation mark
-    r"|'"  # straight single quote
-    r"|\u2018"  # ' left single quotation mark
-    r"|\u2019"  # ' right single quotation mark
-    r"|\u02bc"  # ʼ modifier letter apostrophe
-    r"|\u201b"  # ‛ single high-reversed-9 quotation mark
-    r"|\u00b4"  # ´ acute accent
-    r"|`"  # grave accent / backtick
-    r"|\u2032"  # ′ prime
-    r"|\u2039"  # ‹ single left-pointing angle quotation mark
-    r"|\u203a"  # › single right-pointing angle quotation mark
+    r"[\u201a"  # ‚ single low-9 quotation mark
+    r"'"  # straight single quote
+    r"\u2018"  # ' left single quotation mark
+    r"\u2019"  # ' right single quotation mark
+    r"\u02bc"  # ʼ modifier letter apostrophe
+    r"\u201b"  # ‛ single high-reversed-9 quotation mark
+    r"\u00b4"  # ´ acute accent
+    r"`"  # grave accent / backtick
+    r"\u2032"  # ′ prime
+    r"\u2039"  # ‹ single left-pointing angle quotation mark
+    r"\u203a]"  # › single right-pointing angle quotation mark
 )
 
+_SINGLE_QUOTE_ADEPT_PATTERN = re.compile(SINGLE_QUOTE_ADEPTS)
+
+# Double quote adepts, used to find the double quoted parts that may hold single quotes.
+# Bare characters, so the patterns can use them in both a class and a negated class.
+_DOUBLE_QUOTE_ADEPTS = (
+    r'"'  # straight quote
+    r"\u201c"  # left double quotation mark
+    r"\u201d"  # right double quotation mark
+    r"\u201e"  # double low-9 quotation mark
+    r"\u00ab"  # left guillemet
+    r"\u00bb"  # right guillemet
+)
 
-def _get_locale(locale):
-    """Convert locale string to Locale instance if needed."""
-    if isinstance(locale, str):
-        return Locale(locale)
-    return locale
+_DOUBLE_QUOTE_ADEPT_PATTERN = re.compile(rf"[{_DOUBLE_QUOTE_ADEPTS}]")
 
+# Locale-independent patterns, compiled once at import.
+# Locale-dependent ones are built per locale in _build_patterns.
 
-def identify_contracted_and(text, locale):
-    """
-    Identify 'n' contractions as apostrophes.
-
-    Example:
-        rock 'n' roll -> rock 'n' roll
-        fish 'n' chips -> fish 'n' chips
+# Single quote adept + n + single quote adept, the core every 'n' contraction contains
+_CONTRACTED_N_PATTERN = re.compile(
+    rf"({SINGLE_QUOTE_ADEPTS})"
+    rf"(n)"
+    rf"({SINGLE_QUOTE_ADEPTS})",
+    re.IGNORECASE,
+)
 
-    Exceptions:
-        Press 'N' to continue (should be identified as single quotes)
-    """
-    common_contractions = [
+# Word pairs joined by 'n', e.g. rock 'n' roll
+_CONTRACTED_AND_PATTERNS = [
+    re.compile(
+        rf"({first})"
+        rf"([{SPACES}]?)"
+        rf"({SINGLE_QUOTE_ADEPTS})"
+        rf"(n)"
+        rf"({SINGLE_QUOTE_ADEPTS})"
+        rf"([{SPACES}]?)"
+        rf"({second})",
+        re.IGNORECASE,
+    )
+    for first, second in (
         ("dead", "buried"),
         ("drill", "bass"),
         ("drum", "bass"),
@@ -79,19 +100,180 @@ def identify_contracted_and(text, locale):
         ("drag", "drop"),
         ("rake", "scrape"),
         ("hook", "kill"),
-    ]
-
-    for first, second in common_contractions:
-        pattern = re.compile(
-            rf"({first})"
-            rf"([{SPACES}]?)"
-            rf"({SINGLE_QUOTE_ADEPTS})"
-            rf"(n)"
-            rf"({SINGLE_QUOTE_ADEPTS})"
-            rf"([{SPACES}]?)"
-            rf"({second})",
-            re.IGNORECASE,
-        )
+    )
+]
+
+# Single quote adept + word commonly contracted at its beginning
+_CONTRACTED_BEGINNINGS_PATTERN = re.compile(
+    rf"({SINGLE_QUOTE_ADEPTS})"
+    r"(cause|em|mid|midst|mongst|prentice|round|sblood|sdeath|sfoot|sheart|"
+    r"shun|slid|slife|slight|snails|strewth|til|tis|twas|tween|twere|twill|twixt|twould)",
+    re.IGNORECASE,
+)
+
+# n + single quote adept, the tail of every -in' contraction. Unlike the full pattern,
+# it starts on a literal, so SRE can skip ahead to candidates. Only n and N fold to n.
+_N_BEFORE_QUOTE_PATTERN = re.compile(rf"[nN]{SINGLE_QUOTE_ADEPTS}")
+
+# -in at word end + single quote adept
+_CONTRACTED_ENDS_PATTERN = re.compile(
+    rf"(\Bin)"
+    rf"({SINGLE_QUOTE_ADEPTS})",
+    re.IGNORECASE,
+)
+
+# Letter or digit + single quote adepts + letter
+_IN_WORD_CONTRACTIONS_PATTERN = re.compile(
+    rf"([\d{ALL_CHARS}])"
+    rf"({SINGLE_QUOTE_ADEPTS}+)"
+    rf"([{ALL_CHARS}])"
+)
+
+# Single quote adept + two digits, the tail of every contracted year. The full pattern
+# starts with a class almost every character matches, so probing for this first is cheaper.
+_QUOTE_BEFORE_TWO_DIGITS_PATTERN = re.compile(rf"{SINGLE_QUOTE_ADEPTS}\d{{2}}")
+
+# Non-digit (or capital + digit) + space + single quote adept + two digits
+_CONTRACTED_YEARS_PATTERN = re.compile(
+    rf"([^0-9]|[A-Z][0-9])"
+    rf"([{SPACES}])"
+    rf"({SINGLE_QUOTE_ADEPTS})"
+    rf"([\d]{{2}})"
+)
+
+# Digit + optional space + single prime adept
+_SINGLE_PRIME_AS_FEET_PATTERN = re.compile(
+    rf"(\d)"
+    rf"([{SPACES}]?)"
+    rf"('|\u2018|\u2019|\u201b|\u2032)"
+)
+
+# Start or space/dash + single quote adept + word, ellipsis or opening bracket
+_UNPAIRED_LEFT_SINGLE_QUOTE_PATTERN = re.compile(
+    rf"(^|[{SPACES}{EM_DASH}{EN_DASH}])"
+    rf"({SINGLE_QUOTE_ADEPTS}|,)"
+    rf"([{ALL_CHARS}{ELLIPSIS}{OPENING_BRACKETS}\{{])"
+)
+
+# Word, digit or closing bracket + optional punctuation + single quote adept +
+# optional space or punctuation
+_UNPAIRED_RIGHT_SINGLE_QUOTE_PATTERN = re.compile(
+    rf"([{ALL_CHARS}\d{CLOSING_BRACKETS}])"
+    rf"([{SENTENCE_PUNCTUATION}{ELLIPSIS}])?"
+    rf"({SINGLE_QUOTE_ADEPTS})"
+    rf"([ {SENTENCE_PUNCTUATION}])?"
+)
+
+# Text enclosed in double quote adepts. The content runs up to the next adept on the
+# same line, as a lazy .*? would, but a negated class gets there without backtracking.
+_DOUBLE_QUOTED_TEXT_PATTERN = re.compile(
+    rf"([{_DOUBLE_QUOTE_ADEPTS}])"
+    rf"([^{_DOUBLE_QUOTE_ADEPTS}\n]*)"
+    rf"([{_DOUBLE_QUOTE_ADEPTS}])"
+)
+
+# What the passes over double quoted text act on: a single quote adept, a comma
+# taken for a left single quote, or an unpaired quote label to pair up
+_QUOTED_SINGLE_QUOTE_CANDIDATE_PATTERN = re.compile(rf"{SINGLE_QUOTE_ADEPTS}|,|\{{\{{typopo__")
+
+# Unpaired left single quote + content + unpaired right single quote
+_SINGLE_QUOTE_PAIR_PATTERN = re.compile(
+    r"(\{\{typopo__lsq--unpaired\}\})"
+    r"(.*)"
+    r"(\{\{typopo__rsq--unpaired\}\})"
+)
+
+# Single quote adepts around a single word
+_SINGLE_QUOTE_PAIR_AROUND_SINGLE_WORD_PATTERN = re.compile(
+    rf"(\B)"
+    rf"({SINGLE_QUOTE_ADEPTS})"
+    rf"([{ALL_CHARS}]+)"
+    rf"({SINGLE_QUOTE_ADEPTS})"
+    rf"(\B)"
+)
+
+# Unpaired left single quote + content + single prime
+_LEFT_QUOTE_AND_SINGLE_PRIME_PATTERN = re.compile(
+    r"(\{\{typopo__lsq--unpaired\}\})"
+    r"(.*?)"
+    r"(\{\{typopo__single-prime\}\})"
+)
+
+# Single prime + content + unpaired right single quote
+_SINGLE_PRIME_AND_RIGHT_QUOTE_PATTERN = re.compile(
+    r"(\{\{typopo__single-prime\}\})"
+    r"(.*?)"
+    r"(\{\{typopo__rsq--unpaired\}\})"
+)
+
+# Space + single prime
+_SPACE_BEFORE_SINGLE_PRIME_PATTERN = re.compile(
+    rf"([{SPACES}])"
+    rf"({re.escape(SINGLE_PRIME)})"
+)
+
+
+@cache
+def _build_patterns(locale_id):
+    """Compiled patterns that depend on the locale's single and double quotes."""
+    loc = get_locale(locale_id)
+    left_quote = re.escape(loc.single_quote_open)
+    right_quote = re.escape(loc.single_quote_close)
+    right_double_quote = re.escape(loc.double_quote_close)
+
+    return {
+        # leftQuote + content (no spaces) + notRoman + punct + rightQuote
+        # JS: ([^spaces rightQuote]+?) ([^romanNumerals sentencePunctuation]) ([sentencePunctuation]{1,}) (rightQuote)
+        "quoted_word_punctuation": re.compile(
+            rf"({left_quote})"
+            rf"([^{SPACES}{loc.single_quote_close}]+?)"
+            rf"([^{ROMAN_NUMERALS}{SENTENCE_PUNCTUATION}])"
+            rf"([{SENTENCE_PUNCTUATION}]{{1,}})"
+            rf"({right_quote})"
+        ),
+        # leftQuote + content + space + notRoman (2+ chars) + rightQuote + punct + notRightDoubleQuote
+        # JS: (leftSingleQuote)(.+)([spaces])(?!leftSingleQuote)([^romanNumerals]{2,})(rightSingleQuote)([sentencePunctuation ellipsis])([^rightDoubleQuote])
+        "punctuation_inside_quotes": re.compile(
+            rf"({left_quote})"
+            rf"(.+)"
+            rf"([{SPACES}])(?!{left_quote})"
+            rf"([^{ROMAN_NUMERALS}]{{2,}})"
+            rf"({right_quote})"
+            rf"([{SENTENCE_PUNCTUATION}{ELLIPSIS}])"
+            rf"([^{right_double_quote}])"
+        ),
+        # JS: ([:;])(rightSingleQuote) -> $2$1
+        "colon_outside_quotes": re.compile(
+            rf"([:;])"
+            rf"({right_quote})"
+        ),
+        # JS: ([terminalPunctuation ellipsis])(rightSingleQuote)(rightDoubleQuote) -> $2$1$3
+        "terminal_punctuation_outside_quotes": re.compile(
+            rf"([{TERMINAL_PUNCTUATION}{ELLIPSIS}])"
+            rf"({right_quote})"
+            rf"({right_double_quote})"
+        ),
+    }
+
+
+def identify_contracted_and(text, locale):
+    """
+    Identify 'n' contractions as apostrophes.
+
+    Example:
+        rock 'n' roll -> rock 'n' roll
+        fish 'n' chips -> fish 'n' chips
+
+    Exceptions:
+        Press 'N' to continue (should be identified as single quotes)
+    """
+    # Each pair pattern starts with a literal word, which SRE finds with a fast
+    # prefix search; a single alternation over all pairs loses that and is slower
+    # than the twelve passes. Most texts have no 'n' at all, so probe for it once.
+    if not _CONTRACTED_N_PATTERN.search(text):
+        return text
+
+    for pattern in _CONTRACTED_AND_PATTERNS:
         text = pattern.sub(rf"\1{NBSP}{{{{typopo__apostrophe}}}}\4{{{{typopo__apostrophe}}}}{NBSP}\7", text)
 
     return text
@@ -104,17 +286,7 @@ def identify_contracted_beginnings(text, locale):
     Example:
         'em, 'cause, 'til, 'tis, etc.
     """
-    contracted_words = (
-        "cause|em|mid|midst|mongst|prentice|round|sblood|sdeath|sfoot|sheart|"
-        "shun|slid|slife|slight|snails|strewth|til|tis|twas|tween|twere|twill|twixt|twould"
-    )
-
-    pattern = re.compile(
-        rf"({SINGLE_QUOTE_ADEPTS})"
-        rf"({contracted_words})",
-        re.IGNORECASE,
-    )
-    return pattern.sub(r"{{typopo__apostrophe}}\2", text)
+    return _CONTRACTED_BEGINNINGS_PATTERN.sub(r"{{typopo__apostrophe}}\2", text)
 
 
 def identify_contracted_ends(text, locale):
@@ -124,12 +296,10 @@ def identify_contracted_ends(text, locale):
     Example:
         contraction of an -ing form, e.g. nottin', gettin'
     """
-    pattern = re.compile(
-        rf"(\Bin)"
-        rf"({SINGLE_QUOTE_ADEPTS})",
-        re.IGNORECASE,
-    )
-    return pattern.sub(r"\1{{typopo__apostrophe}}", text)
+    if not _N_BEFORE_QUOTE_PATTERN.search(text):
+        return text
+
+    return _CONTRACTED_ENDS_PATTERN.sub(r"\1{{typopo__apostrophe}}", text)
 
 
 def identify_in_word_contractions(text, locale):
@@ -139,12 +309,7 @@ def identify_in_word_contractions(text, locale):
     Examples:
         Don't, I'm, O'Doole, 69'ers, iPhone6's
     """
-    pattern = re.compile(
-        rf"([\d{ALL_CHARS}])"
-        rf"({SINGLE_QUOTE_ADEPTS})+"
-        rf"([{ALL_CHARS}])"
-    )
-    return pattern.sub(r"\1{{typopo__apostrophe}}\3", text)
+    return _IN_WORD_CONTRACTIONS_PATTERN.sub(r"\1{{typopo__apostrophe}}\3", text)
 
 
 def identify_contracted_years(text, locale):
@@ -157,13 +322,10 @@ def identify_contracted_years(text, locale):
     Exceptions:
         12 '45" (wrongly spaced feet - not a year)
     """
-    pattern = re.compile(
-        rf"([^0-9]|[A-Z][0-9])"
-        rf"([{SPACES}])"
-        rf"({SINGLE_QUOTE_ADEPTS})"
-        rf"([\d]{{2}})"
-    )
-    return pattern.sub(r"\1\2{{typopo__apostrophe}}\4", text)
+    if not _QUOTE_BEFORE_TWO_DIGITS_PATTERN.search(text):
+        return text
+
+    return _CONTRACTED_YEARS_PATTERN.sub(r"\1\2{{typopo__apostrophe}}\4", text)
 
 
 def identify_single_prime_as_feet(text, locale):
@@ -178,12 +340,7 @@ def identify_single_prime_as_feet(text, locale):
     'Konference 2020' in quotes -> 'Konference 2020' in quotes
     This is corrected in replace_single_prime_with_single_quote
     """
-    pattern = re.compile(
-        rf"(\d)"
-        rf"([{SPACES}]?)"
-        rf"('|\u2018|\u2019|\u201b|\u2032)"
-    )
-    return pattern.sub(r"\1\2{{typopo__single-prime}}", text)
+    return _SINGLE_PRIME_AS_FEET_PATTERN.sub(r"\1\2{{typopo__single-prime}}", text)
 
 
 def identify_unpaired_left_single_quote(text, locale):
@@ -195,12 +352,7 @@ def identify_unpaired_left_single_quote(text, locale):
     - following a space, en dash or em dash (or at start of string)
     - preceding a word, ellipsis, or opening bracket
     """
-    pattern = re.compile(
-        rf"(^|[{SPACES}{EM_DASH}{EN_DASH}])"
-        rf"({SINGLE_QUOTE_ADEPTS}|,)"
-        rf"([{ALL_CHARS}{ELLIPSIS}{OPENING_BRACKETS}\{{])"
-    )
-    return pattern.sub(r"\1{{typopo__lsq--unpaired}}\3", text)
+    return _UNPAIRED_LEFT_SINGLE_QUOTE_PATTERN.sub(r"\1{{typopo__lsq--unpaired}}\3", text)
 
 
 def identify_unpaired_right_single_quote(text, locale):
@@ -213,13 +365,7 @@ def identify_unpaired_right_single_quote(text, locale):
     - optionally, following a sentence punctuation
     - optionally, preceding a space or a sentence punctuation
     """
-    pattern = re.compile(
-        rf"([{ALL_CHARS}\d{CLOSING_BRACKETS}])"
-        rf"([{SENTENCE_PUNCTUATION}{ELLIPSIS}])?"
-        rf"({SINGLE_QUOTE_ADEPTS})"
-        rf"([ {SENTENCE_PUNCTUATION}])?"
-    )
-    return pattern.sub(r"\1\2{{typopo__rsq--unpaired}}\4", text)
+    return _UNPAIRED_RIGHT_SINGLE_QUOTE_PATTERN.sub(r"\1\2{{typopo__rsq--unpaired}}\4", text)
 
 
 def identify_single_quotes_within_double_quotes(text, locale):
@@ -238,17 +384,12 @@ def identify_single_quotes_within_double_quotes(text, locale):
       - unpaired right single quote
       - single quote pairs
     """
-    # Double quote adepts pattern
-    double_quote_adepts = (
-        r'"'  # straight quote
-        r"|\u201c"  # left double quotation mark
-        r"|\u201d"  # right double quotation mark
-        r"|\u201e"  # double low-9 quotation mark
-        r"|\u00ab"  # left guillemet
-        r"|\u00bb"  # right guillemet
-    )
 
     def process_inner(match):
+        # Most quoted text holds no single quotes; one search spares it three passes
+        if not _QUOTED_SINGLE_QUOTE_CANDIDATE_PATTERN.search(match.group(2)):
+            return match.group(0)
+
         left_dq = match.group(1)
         content = match.group(2)
         right_dq = match.group(3)
@@ -259,12 +400,7 @@ def identify_single_quotes_within_double_quotes(text, locale):
 
         return left_dq + content + right_dq
 
-    pattern = re.compile(
-        rf"({double_quote_adepts})"
-        rf"(.*?)"
-        rf"({double_quote_adepts})"
-    )
-    return pattern.sub(process_inner, text)
+    return _DOUBLE_QUOTED_TEXT_PATTERN.sub(process_inner, text)
 
 
 def identify_single_quote_pairs(text, locale):
@@ -279,12 +415,7 @@ def identify_single_quote_pairs(text, locale):
     - It is difficult to identify all contractions at the end of word, and thus
       it is difficult to identify single quote pairs.
     """
-    pattern = re.compile(
-        r"(\{\{typopo__lsq--unpaired\}\})"
-        r"(.*)"
-        r"(\{\{typopo__rsq--unpaired\}\})"
-    )
-    return pattern.sub(r"{{typopo__lsq}}\2{{typopo__rsq}}", text)
+    return _SINGLE_QUOTE_PAIR_PATTERN.sub(r"{{typopo__lsq}}\2{{typopo__rsq}}", text)
 
 
 def identify_single_quote_pair_around_single_word(text, locale):
@@ -295,14 +426,7 @@ def identify_single_quote_pair_around_single_word(text, locale):
         'word' -> 'word'
         Press 'N' to get started -> Press 'N' to get started
     """
-    pattern = re.compile(
-        rf"(\B)"
-        rf"({SINGLE_QUOTE_ADEPTS})"
-        rf"([{ALL_CHARS}]+)"
-        rf"({SINGLE_QUOTE_ADEPTS})"
-        rf"(\B)"
-    )
-    return pattern.sub(r"\1{{typopo__lsq}}\3{{typopo__rsq}}\5", text)
+    return _SINGLE_QUOTE_PAIR_AROUND_SINGLE_WORD_PATTERN.sub(r"\1{{typopo__lsq}}\3{{typopo__rsq}}\5", text)
 
 
 def identify_residual_apostrophes(text, locale):
@@ -313,8 +437,9 @@ def identify_residual_apostrophes(text, locale):
     Limitation: This function runs as last in the row of identification functions
     as it catches what's left.
     """
-    pattern = re.compile(rf"({SINGLE_QUOTE_ADEPTS})")
-    return pattern.sub(r"{{typopo__apostrophe}}", text)
+    # One C-level substitution; str.translate would be several times slower here, as its
+    # fast path only covers ASCII-to-single-character tables
+    return _SINGLE_QUOTE_ADEPT_PATTERN.sub("{{typopo__apostrophe}}", text)
 
 
 def replace_single_prime_with_single_quote(text, locale):
@@ -332,20 +457,10 @@ def replace_single_prime_with_single_quote(text, locale):
     a single quote pair.
     """
     # Pattern: unpaired-left + content + single-prime -> quote pair
-    pattern1 = re.compile(
-        r"(\{\{typopo__lsq--unpaired\}\})"
-        r"(.*?)"
-        r"(\{\{typopo__single-prime\}\})"
-    )
-    text = pattern1.sub(r"{{typopo__lsq}}\2{{typopo__rsq}}", text)
+    text = _LEFT_QUOTE_AND_SINGLE_PRIME_PATTERN.sub(r"{{typopo__lsq}}\2{{typopo__rsq}}", text)
 
     # Pattern: single-prime + content + unpaired-right -> quote pair
-    pattern2 = re.compile(
-        r"(\{\{typopo__single-prime\}\})"
-        r"(.*?)"
-        r"(\{\{typopo__rsq--unpaired\}\})"
-    )
-    text = pattern2.sub(r"{{typopo__lsq}}\2{{typopo__rsq}}", text)
+    text = _SINGLE_PRIME_AND_RIGHT_QUOTE_PATTERN.sub(r"{{typopo__lsq}}\2{{typopo__rsq}}", text)
 
     return text
 
@@ -366,19 +481,11 @@ def fix_quoted_word_punctuation(text, locale):
     Exception:
         'IV.' - preserves roman numeral punctuation
     """
-    loc = _get_locale(locale)
-    left_quote = re.escape(loc.single_quote_open)
-    right_quote = re.escape(loc.single_quote_close)
+    loc = get_locale(locale)
+    if loc.single_quote_close not in text:
+        return text
 
-    # Pattern matches: leftQuote + content (no spaces) + notRoman + punct + rightQuote
-    # JS: ([^spaces rightQuote]+?) ([^romanNumerals sentencePunctuation]) ([sentencePunctuation]{1,}) (rightQuote)
-    pattern = re.compile(
-        rf"({left_quote})"
-        rf"([^{SPACES}{loc.single_quote_close}]+?)"
-        rf"([^{ROMAN_NUMERALS}{SENTENCE_PUNCTUATION}])"
-        rf"([{SENTENCE_PUNCTUATION}]{{1,}})"
-        rf"({right_quote})"
-    )
+    pattern = _build_patterns(loc.locale_id)["quoted_word_punctuation"]
 
     def replacer(match):
         left_q, content, not_roman, punct, right_q = match.groups()
@@ -406,42 +513,22 @@ def fix_quoted_sentence_punctuation(text, locale):
         'quoted fragment:' -> 'quoted fragment':  (colon outside)
         "...'quoted fragment.'" -> "...'quoted fragment'."  (at end of double quote)
     """
-    loc = _get_locale(locale)
-    left_quote = re.escape(loc.single_quote_open)
-    right_quote = re.escape(loc.single_quote_close)
-    right_double_quote = re.escape(loc.double_quote_close)
+    # Every step moves punctuation across a right single quote
+    loc = get_locale(locale)
+    if loc.single_quote_close not in text:
+        return text
+
+    patterns = _build_patterns(loc.locale_id)
 
     # Step 1: Move punctuation INSIDE quotes (for multi-word fragments within a sentence)
-    # Pattern: leftQuote + content + space + notRoman (2+ chars) + rightQuote + punct + notRightDoubleQuote
-    # JS: (leftSingleQuote)(.+)([spaces])(?!leftSingleQuote)([^romanNumerals]{2,})(rightSingleQuote)([sentencePunctuation ellipsis])([^rightDoubleQuote])
-    pattern1 = re.compile(
-        rf"({left_quote})"
-        rf"(.+)"
-        rf"([{SPACES}])(?!{left_quote})"
-        rf"([^{ROMAN_NUMERALS}]{{2,}})"
-        rf"({right_quote})"
-        rf"([{SENTENCE_PUNCTUATION}{ELLIPSIS}])"
-        rf"([^{right_double_quote}])"
-    )
     # Swap $5 and $6: move punct inside before rightQuote
-    text = pattern1.sub(r"\1\2\3\4\6\5\7", text)
+    text = patterns["punctuation_inside_quotes"].sub(r"\1\2\3\4\6\5\7", text)
 
     # Step 2: Move colons and semicolons OUTSIDE quotes
-    # JS: ([:;])(rightSingleQuote) -> $2$1
-    pattern2 = re.compile(
-        rf"([:;])"
-        rf"({right_quote})"
-    )
-    text = pattern2.sub(r"\2\1", text)
+    text = patterns["colon_outside_quotes"].sub(r"\2\1", text)
 
     # Step 3: Move terminal punctuation (.?!...) OUTSIDE when at end of double-quoted sentence
-    # JS: ([terminalPunctuation ellipsis])(rightSingleQuote)(rightDoubleQuote) -> $2$1$3
-    pattern3 = re.compile(
-        rf"([{TERMINAL_PUNCTUATION}{ELLIPSIS}])"
-        rf"({right_quote})"
-        rf"({right_double_quote})"
-    )
-    text = pattern3.sub(r"\2\1\3", text)
+    text = patterns["terminal_punctuation_outside_quotes"].sub(r"\2\1\3", text)
 
     return text
 
@@ -472,11 +559,12 @@ def remove_extra_space_around_single_prime(text, locale):
     The function runs after all single quotes and single primes
     have been identified.
     """
-    pattern = re.compile(
-        rf"([{SPACES}])"
-        rf"({re.escape(SINGLE_PRIME)})"
-    )
-    return pattern.sub(r"\2", text)
+    if SINGLE_PRIME not in text:
+        return text
+
+    # One space goes per prime, so replacing each space + prime pair in turn would not do:
+    # with two different spaces before a prime, it would remove both
+    return _SPACE_BEFORE_SINGLE_PRIME_PATTERN.sub(SINGLE_PRIME, text)
 
 
 def place_locale_single_quotes(text, locale):
@@ -488,15 +576,20 @@ def place_locale_single_quotes(text, locale):
     adepts, then replace them temporarily with labels as "{{typopo__single-prime}}".
     This is the function in the sequence to swap temporary labels to quotes.
     """
-    loc = _get_locale(locale)
+    # One search for the common prefix settles text with no labels at all
+    if "{{typopo__" not in text:
+        return text
+
+    loc = get_locale(locale)
 
     # Replace single prime placeholder
     text = text.replace("{{typopo__single-prime}}", SINGLE_PRIME)
 
     # Replace apostrophe and unpaired quotes with apostrophe
-    text = re.sub(
-        r"\{\{typopo__apostrophe\}\}|\{\{typopo__lsq--unpaired\}\}|\{\{typopo__rsq--unpaired\}\}", APOSTROPHE, text
-    )
+    # The labels are literals, so plain replaces beat a regex alternation over them
+    text = text.replace("{{typopo__apostrophe}}", APOSTROPHE)
+    text = text.replace("{{typopo__lsq--unpaired}}", APOSTROPHE)
+    text = text.replace("{{typopo__rsq--unpaired}}", APOSTROPHE)
 
     # Replace paired quotes with locale-specific quotes
     text = text.replace("{{typopo__lsq}}", loc.single_quote_open)
@@ -533,7 +626,17 @@ def fix_single_quotes_primes_and_apostrophes(text, locale):
     Returns:
         Text with proper single quotes, primes and apostrophes
     """
-    loc = _get_locale(locale)
+    # Every step needs a single quote adept or a label, except that a comma within
+    # double quotes may be taken for a left single quote. Text with none of these
+    # is common and would otherwise go through a dozen passes that change nothing.
+    if (
+        not _SINGLE_QUOTE_ADEPT_PATTERN.search(text)
+        and "{{typopo__" not in text
+        and ("," not in text or not _DOUBLE_QUOTE_ADEPT_PATTERN.search(text))
+    ):
+        return text
+
+    loc = get_locale(locale)
 
     # [1] Identify common apostrophe contractions
     text = identify_contracted_and(text, loc)
@@ -5,12 +5,19 @@ Port of src/lib/symbols/copyrights.js from typopo.
 """
 
 import re
+from functools import cache
 
 from pytypopo.const import COPYRIGHT, SOUND_RECORDING_COPYRIGHT, SPACES
 from pytypopo.locale.base import get_locale
 from pytypopo.modules.symbols.section_sign import fix_spacing_around_symbol
 
 
+@cache
+def _copyright_pattern(letter):
+    """Compiled pattern for (letter) + optional spaces + digit, built once per letter."""
+    return re.compile(rf"\({letter}\)([{SPACES}]*)(\d)", re.IGNORECASE)
+
+
 def _replace_copyright(text, letter, symbol):
     """
     Replace parenthesized letter with copyright symbol when followed by a digit.
@@ -26,10 +33,13 @@ def _replace_copyright(text, letter, symbol):
     Returns:
         Text with replacements made
     """
+    # Only the ASCII letter matches either case, so two literal searches rule it out
+    if f"({letter})" not in text and f"({letter.upper()})" not in text:
+        return text
+
     # Pattern: (letter) + optional spaces + digit
     # Must have a digit following to distinguish from section references
-    pattern = re.compile(rf"\({letter}\)([{SPACES}]*)(\d)", re.IGNORECASE)
-    return pattern.sub(rf"{symbol}\1\2", text)
+    return _copyright_pattern(letter).sub(rf"{symbol}\1\2", text)
 
 
 def fix_copyrights(text, locale):
@@ -5,6 +5,7 @@ Port of src/lib/symbols/exponents.js from typopo.
 """
 
 import re
+from functools import cache
 
 from pytypopo.const import SLASH, SPACES
 
@@ -18,6 +19,12 @@ METRE_PREFIXES = (
 )
 
 
+@cache
+def _exponent_pattern(original):
+    """Compiled pattern for (space or slash) + metric prefix + exponent digit, built once per digit."""
+    return re.compile(rf"([{SPACES}{SLASH}])({METRE_PREFIXES})({original})\b")
+
+
 def _fix_exponent(text, original, replacement):
     """
     Replace exponent digit with superscript for metric units.
@@ -33,10 +40,13 @@ def _fix_exponent(text, original, replacement):
     Returns:
         Text with exponents fixed
     """
+    # Every metric prefix ends with "m", so the unit always leaves "m" + digit in the text
+    if "m" + original not in text:
+        return text
+
     # Pattern: (space or slash) + metric prefix + exponent digit
     # Word boundary is enforced by requiring space/slash before
-    pattern = re.compile(rf"([{SPACES}{SLASH}])({METRE_PREFIXES})({original})\b")
-    return pattern.sub(rf"\1\2{replacement}", text)
+    return _exponent_pattern(original).sub(rf"\1\2{replacement}", text)
 
 
 def fix_exponents(text, locale):
@@ -5,10 +5,17 @@ Port of src/lib/symbols/marks.js from typopo.
 """
 
 import re
+from functools import cache
 
 from pytypopo.const import REGISTERED_TRADEMARK, SERVICE_MARK, SPACES, TRADEMARK
 
 
+@cache
+def _mark_pattern(mark_pattern, symbol):
+    """Compiled pattern for a mark and its symbol, built once per mark."""
+    return re.compile(rf"([^0-9]|^)([{SPACES}]*)(\({mark_pattern}\)|{re.escape(symbol)})", re.IGNORECASE)
+
+
 def _replace_mark(text, mark_pattern, symbol):
     """
     Replace parenthesized mark with symbol, removing preceding spaces.
@@ -25,11 +32,13 @@ def _replace_mark(text, mark_pattern, symbol):
     Returns:
         Text with replacements made
     """
+    if "(" not in text and symbol not in text:
+        return text
+
     # Pattern: (non-digit or start) + optional spaces + ((mark) or symbol)
     # [^0-9] avoids false positives after numbers (e.g., "Section 7(r)")
     # Also handles existing symbols that need spacing fixed
-    pattern = re.compile(rf"([^0-9]|^)([{SPACES}]*)(\({mark_pattern}\)|{re.escape(symbol)})", re.IGNORECASE)
-    return pattern.sub(rf"\1{symbol}", text)
+    return _mark_pattern(mark_pattern, symbol).sub(rf"\1{symbol}", text)
 
 
 def fix_marks(text, locale):
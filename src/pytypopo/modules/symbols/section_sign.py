@@ -37,6 +37,10 @@ def fix_spacing_around_symbol(text, symbol, space_after):
     Returns:
         Text with spacing fixed around the symbol
     """
+    # Every step needs the symbol
+    if symbol not in text:
+        return text
+
     escaped_symbol = re.escape(symbol)
 
     # Step 1: Add space before symbol when preceded by word/punctuation/closing chars
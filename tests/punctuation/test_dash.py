@@ -690,6 +690,10 @@ class TestDashBetweenCardinalNumbers:
         result = fix_dash(input_text, locale)
         assert result == expected
 
+    def test_placeholder_like_text_is_kept(self):
+        """Text resembling the former en dash placeholder is not rewritten."""
+        assert fix_dash_between_cardinal_numbers("{{typopo__endash}}") == "{{typopo__endash}}"
+
 
 class TestDashBetweenPercentageRange:
     """
@@ -6,8 +6,14 @@ Port of tests/punctuation/double-quotes.test.js from typopo.
 
 import pytest
 
+from pytypopo import fix_typos
 from pytypopo.locale import Locale
 from pytypopo.modules.punctuation.double_quotes import (
+    _DOUBLE_PRIME_LABEL,
+    _LEFT_DOUBLE_QUOTE_LABEL,
+    _RIGHT_DOUBLE_QUOTE_LABEL,
+    _UNPAIRED_LEFT_DOUBLE_QUOTE_LABEL,
+    _UNPAIRED_RIGHT_DOUBLE_QUOTE_LABEL,
     add_space_after_right_double_quote,
     add_space_before_left_double_quote,
     fix_direct_speech_intro,
@@ -484,22 +490,22 @@ class TestIdentifyDoubleQuotePairsUnit:
     def test_quote_pair_with_spaces(self, locale_id):
         text = '" quoted material "'
         result = identify_double_quote_pairs(text, locale_id)
-        assert "{{typopo__ldq}}" in result
-        assert "{{typopo__rdq}}" in result
+        assert _LEFT_DOUBLE_QUOTE_LABEL in result
+        assert _RIGHT_DOUBLE_QUOTE_LABEL in result
 
     @pytest.mark.parametrize("locale_id", ALL_LOCALES)
     def test_quote_pair_left_space_only(self, locale_id):
         text = '"quoted material "'
         result = identify_double_quote_pairs(text, locale_id)
-        assert "{{typopo__ldq}}" in result
-        assert "{{typopo__rdq}}" in result
+        assert _LEFT_DOUBLE_QUOTE_LABEL in result
+        assert _RIGHT_DOUBLE_QUOTE_LABEL in result
 
     @pytest.mark.parametrize("locale_id", ALL_LOCALES)
     def test_quote_pair_right_space_only(self, locale_id):
         text = '" quoted material"'
         result = identify_double_quote_pairs(text, locale_id)
-        assert "{{typopo__ldq}}" in result
-        assert "{{typopo__rdq}}" in result
+        assert _LEFT_DOUBLE_QUOTE_LABEL in result
+        assert _RIGHT_DOUBLE_QUOTE_LABEL in result
 
 
 # =============================================================================
@@ -775,16 +781,16 @@ class TestReplaceDoublePrimeWithDoubleQuote:
     @pytest.mark.parametrize("locale_id", ALL_LOCALES)
     def test_unpaired_left_quote_with_double_prime(self, locale_id):
         """Unpaired left quote + double prime -> quote pair."""
-        text = "{{typopo__ldq--unpaired}}word{{typopo__double-prime}}"
+        text = f"{_UNPAIRED_LEFT_DOUBLE_QUOTE_LABEL}word{_DOUBLE_PRIME_LABEL}"
         result = replace_double_prime_with_double_quote(text, locale_id)
-        assert result == "{{typopo__ldq}}word{{typopo__rdq}}"
+        assert result == f"{_LEFT_DOUBLE_QUOTE_LABEL}word{_RIGHT_DOUBLE_QUOTE_LABEL}"
 
     @pytest.mark.parametrize("locale_id", ALL_LOCALES)
     def test_double_prime_with_unpaired_right_quote(self, locale_id):
         """Double prime + unpaired right quote -> quote pair."""
-        text = "{{typopo__double-prime}}word{{typopo__rdq--unpaired}}"
+        text = f"{_DOUBLE_PRIME_LABEL}word{_UNPAIRED_RIGHT_DOUBLE_QUOTE_LABEL}"
         result = replace_double_prime_with_double_quote(text, locale_id)
-        assert result == "{{typopo__ldq}}word{{typopo__rdq}}"
+        assert result == f"{_LEFT_DOUBLE_QUOTE_LABEL}word{_RIGHT_DOUBLE_QUOTE_LABEL}"
 
     # Module tests (full pipeline)
     @pytest.mark.parametrize("locale_id", ALL_LOCALES)
@@ -906,6 +912,21 @@ class TestFixQuotedSentencePunctuation:
         expected = f"{q['ldq']}quoted part{q['rdq']};"
         assert fix_quoted_sentence_punctuation(text, locale_id) == expected
 
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_long_line_of_unclosed_quotes(self, locale_id):
+        """Many unclosed quotes on one line are handled in linear time."""
+        q = get_quotes(locale_id)
+        text = f"{q['ldq']}a b " * 2000 + f"I{q['rdq']}."
+        assert fix_quoted_sentence_punctuation(text, locale_id) == text
+
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_last_quote_on_line_is_used(self, locale_id):
+        """Only the last right quote + punctuation of a line is swapped, like the greedy typopo pattern."""
+        q = get_quotes(locale_id)
+        text = f"{q['ldq']}one two{q['rdq']}. {q['ldq']}three four{q['rdq']}."
+        expected = f"{q['ldq']}one two{q['rdq']}. {q['ldq']}three four.{q['rdq']}"
+        assert fix_quoted_sentence_punctuation(text, locale_id) == expected
+
 
 # =============================================================================
 # REMOVE EXTRA SPACES AROUND QUOTES
@@ -1542,6 +1563,20 @@ class TestFixDirectSpeechIntro:
         text = f"She said{intro} {q['ldq']}Hello{q['rdq']} and left."
         assert fix_direct_speech_intro(text, locale_id) == text
 
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_dash_after_quote_on_next_line_is_kept(self, locale_id):
+        """Quoted speech does not continue past the end of the line."""
+        q = get_quotes(locale_id)
+        text = f"{q['ldq']}Hello\n{q['rdq']} - and left."
+        assert fix_direct_speech_intro(text, locale_id) == text
+
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_long_line_of_unclosed_quotes(self, locale_id):
+        """Many unclosed quotes on one line are handled in linear time."""
+        q = get_quotes(locale_id)
+        text = f"{q['ldq']}a " * 20000 + "- and left."
+        assert fix_direct_speech_intro(text, locale_id) == text
+
 
 # =============================================================================
 # INTEGRATION TESTS - fix_double_quotes_and_primes
@@ -1577,3 +1612,28 @@ class TestFixDoubleQuotesAndPrimes:
         text = 'She said - "Hello" - and left.'
         expected = f"She said{intro} {q['ldq']}Hello{q['rdq']} and left."
         assert fix_double_quotes_and_primes(text, locale_id) == expected
+
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_placeholder_like_text_is_kept(self, locale_id):
+        """Text resembling the former quote placeholders is not rewritten."""
+        text = "{{typopo__ldq}}word{{typopo__rdq}}"
+        assert fix_double_quotes_and_primes(text, locale_id) == text
+
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_label_code_points_in_input_are_kept(self, locale_id):
+        """Private-use characters that serve as labels pass through unchanged."""
+        q = get_quotes(locale_id)
+        labels = (
+            f"{_DOUBLE_PRIME_LABEL}{_LEFT_DOUBLE_QUOTE_LABEL}{_RIGHT_DOUBLE_QUOTE_LABEL}"
+            f"{_UNPAIRED_LEFT_DOUBLE_QUOTE_LABEL}{_UNPAIRED_RIGHT_DOUBLE_QUOTE_LABEL}"
+        )
+        text = f'Icon{_DOUBLE_PRIME_LABEL} and {labels} "x" here, 12" wide.'
+        expected = f"Icon{_DOUBLE_PRIME_LABEL} and {labels} {q['ldq']}x{q['rdq']} here, 12\u2033 wide."
+        assert fix_double_quotes_and_primes(text, locale_id) == expected
+        assert fix_typos(text, locale_id) == expected
+
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_text_without_quotes_is_kept(self, locale_id):
+        """Text without any quote adept passes through unchanged."""
+        text = "Plain text, without quotes; all fine."
+        assert fix_double_quotes_and_primes(text, locale_id) == text
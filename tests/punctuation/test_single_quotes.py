@@ -1055,6 +1055,12 @@ class TestIdentifyInWordContractionsUnit:
         result = identify_in_word_contractions(text, Locale(locale_id))
         assert result == "don{{typopo__apostrophe}}t"
 
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_long_run_of_quotes(self, locale_id):
+        text = "don" + "'" * 10000 + "t"
+        result = identify_in_word_contractions(text, Locale(locale_id))
+        assert result == "don{{typopo__apostrophe}}t"
+
     @pytest.mark.parametrize("locale_id", ALL_LOCALES)
     def test_dont_double_quote(self, locale_id):
         text = "don''t"
@@ -1392,6 +1398,12 @@ class TestIdentifySingleQuotesWithinDoubleQuotesUnit:
         assert "{{typopo__lsq}}" in result
         assert "{{typopo__rsq}}" in result
 
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_double_quotes_on_different_lines(self, locale_id):
+        text = "\"What about\n'word', is that good?\""
+        result = identify_single_quotes_within_double_quotes(text, Locale(locale_id))
+        assert result == text
+
 
 class TestIdentifySingleQuotePairsUnit:
     """Unit tests for identify_single_quote_pairs function."""
@@ -1508,6 +1520,12 @@ class TestRemoveExtraSpaceAroundSinglePrimeUnit:
         result = remove_extra_space_around_single_prime(text, Locale(locale_id))
         assert result == f"12{SINGLE_PRIME}45\u2033"
 
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_remove_only_one_space_before_prime(self, locale_id):
+        text = f"12{NBSP} {SINGLE_PRIME}"
+        result = remove_extra_space_around_single_prime(text, Locale(locale_id))
+        assert result == f"12{NBSP}{SINGLE_PRIME}"
+
 
 class TestPlaceLocaleSingleQuotesUnit:
     """Unit tests for place_locale_single_quotes function."""
@@ -1573,6 +1591,18 @@ class TestFixSingleQuotesPrimesAndApostrophes:
         expected = f"I{APOSTROPHE}m listening to rock{NBSP}{APOSTROPHE}n{APOSTROPHE}{NBSP}roll in the {APOSTROPHE}70s"
         assert result == expected
 
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_text_without_quotes(self, locale_id):
+        text = "Nothing to fix here, really.\nSecond line"
+        result = fix_single_quotes_primes_and_apostrophes(text, locale_id)
+        assert result == text
+
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_comma_as_left_quote_within_double_quotes(self, locale_id):
+        text = '"a ,word"'
+        result = fix_single_quotes_primes_and_apostrophes(text, locale_id)
+        assert result == f'"a {APOSTROPHE}word"'
+
 
 class TestSwapSingleQuotesAndTerminalPunctuationUnit:
     """Additional unit tests for swap_single_quotes_and_terminal_punctuation function."""
@@ -166,6 +166,24 @@ class TestExceptions:
         assert result == expected
 
 
+# Plain-word texts that take the fix_typos fast path and stay unchanged
+PLAIN_WORDS_TESTS = [
+    "Hello world",
+    "plain lowercase words only",
+    "First line\nSecond line",
+]
+
+# Near misses of the fast path that still need the full pipeline
+PLAIN_WORDS_NEAR_MISS_TESTS = {
+    # Single-letter preposition gets nbsp
+    "buy a cat": f"buy a{NBSP}cat",
+    # Accidental uppercase is corrected
+    "JEnnifer here": "Jennifer here",
+    # Leading and trailing spaces are removed
+    " Hello world ": "Hello world",
+}
+
+
 class TestApostrophes:
     """Test that contractions with apostrophes are handled correctly."""
 
@@ -235,3 +253,29 @@ class TestLocaleNormalization:
         """None locale should default to en-us."""
         result = fix_typos("Hello   world", None)
         assert result == "Hello world"
+
+
+class TestPlainWordsFastPath:
+    """Test the fast path for text that no rule can change."""
+
+    @pytest.mark.parametrize("input_text", PLAIN_WORDS_TESTS)
+    @pytest.mark.parametrize("locale", ALL_LOCALES)
+    def test_plain_words_unchanged(self, input_text, locale):
+        assert fix_typos(input_text, locale) == input_text
+
+    @pytest.mark.parametrize(("input_text", "expected"), PLAIN_WORDS_NEAR_MISS_TESTS.items())
+    def test_near_misses_still_fixed(self, input_text, expected):
+        assert fix_typos(input_text, "en-us") == expected
+
+
+class TestPipelineCache:
+    """Test that cached per-locale pipelines keep locales apart."""
+
+    def test_alternating_locales(self):
+        """Switching locales between calls uses the matching pipeline."""
+        text = 'He said "hello".'
+        en_us = fix_typos(text, "en-us")
+        de_de = fix_typos(text, "de-de")
+        assert en_us == "He said \u201chello\u201d."
+        assert de_de == "He said \u201ehello\u201c."
+        assert fix_typos(text, "en-us") == en_us
@@ -121,6 +121,29 @@ class TestGetLocaleFunction:
         assert locale_upper.locale_id == "en-us"
         assert locale_mixed.locale_id == "en-us"
 
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_get_locale_returns_cached_instance(self, locale_id):
+        """get_locale() shares one instance per normalized locale ID."""
+        assert get_locale(locale_id) is get_locale(locale_id.upper())
+        assert get_locale(locale_id) is get_locale(f" {locale_id} ")
+
+    def test_get_locale_invalid_shares_default_instance(self):
+        """Invalid locale IDs resolve to the cached en-us instance."""
+        assert get_locale("invalid") is get_locale("en-us")
+        assert get_locale(None) is get_locale("en-us")
+
+    def test_shared_locale_is_read_only(self):
+        """Cached instances are shared, so their settings cannot be changed."""
+        locale = get_locale("cs")
+        with pytest.raises(AttributeError):
+            locale.dash_char = "-"
+        assert locale.dash_char == "\u2013"
+
+    def test_get_locale_passes_through_locale_instance(self):
+        """get_locale() returns an existing Locale instance unchanged."""
+        locale = Locale("cs")
+        assert get_locale(locale) is locale
+
 
 class TestQuoteCharacters:
     """Tests for locale-specific quote character mappings."""
@@ -271,6 +294,12 @@ class TestLocaleProperties:
         assert locale.single_quote_close in locale.terminal_quotes
         assert locale.double_quote_close in locale.terminal_quotes
 
+    @pytest.mark.parametrize("locale_id", ALL_LOCALES)
+    def test_locale_has_dash_replacement(self, locale_id):
+        """Each locale has dash_replacement combining the dash with its spaces."""
+        locale = get_locale(locale_id)
+        assert locale.dash_replacement == locale.dash_space_before + locale.dash_char + locale.dash_space_after
+
     @pytest.mark.parametrize("locale_id", ALL_LOCALES)
     def test_locale_has_ordinal_indicator(self, locale_id):
         """Each locale has an ordinal_indicator property."""